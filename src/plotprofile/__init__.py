@@ -1 +1 @@
-from .plot import ReactionProfilePlotter, plot_reaction_profile
\ No newline at end of file
+from .plot import ReactionProfilePlotter, ProfileTemplate, plot_reaction_profile
\ No newline at end of file
@@ -0,0 +1,161 @@
+import csv
+import json
+
+import numpy as np
+
+from .ensemble import GAS_CONSTANT
+
+BOLTZMANN = 1.380649e-23  # J/K
+PLANCK = 6.62607015e-34   # J s
+
+FIELDS = [
+    'label', 'energetic_span', 'tdi', 'tdts', 'tdi_energy', 'tdts_energy',
+    'effective_barrier', 'reaction_energy', 'tof',
+]
+
+
+def _as_profiles(energy_data):
+    """Normalise the dict / list of lists / single list inputs that ``plot()`` accepts."""
+    if isinstance(energy_data, dict):
+        return list(energy_data.keys()), list(energy_data.values())
+    if isinstance(energy_data, list):
+        if all(isinstance(sublist, list) for sublist in energy_data):
+            return [f"_unlabeled_{i}" for i in range(len(energy_data))], energy_data
+        return ["_unlabeled_"], [energy_data]
+    raise TypeError("Data input must be a dict, list of lists, or a single list.")
+
+
+def _compact(values, index):
+    """Move the non-NaN entries of each row to the front, keeping their order."""
+    order = np.argsort(np.isnan(values), axis=1, kind='stable')
+    return np.take_along_axis(values, order, axis=1), np.take_along_axis(index, order, axis=1)
+
+
+def _running_min(values, keep_last=False):
+    """Minimum of ``values[:, :t]`` for every column ``t`` and the column holding it (-1 if none).
+
+    Ties keep the first such column, or the last with ``keep_last=True``.
+    """
+    n, width = values.shape
+    shifted = np.full_like(values, np.inf)
+    shifted[:, 1:] = values[:, :-1]
+    minimum = np.minimum.accumulate(shifted, axis=1)
+    previous = np.full_like(values, np.inf)
+    previous[:, 1:] = minimum[:, :-1]
+    improved = (shifted <= previous) if keep_last else (shifted < previous)
+    improved &= np.isfinite(shifted)
+    at = np.maximum.accumulate(np.where(improved, np.arange(width) - 1, -1), axis=1)
+    return minimum, at
+
+
+def energetic_span_matrix(matrix, temperature=298.15, units='kcal'):
+    """Energetic span analysis of every row of a NaN-padded ``(n_profiles, n_points)`` array.
+
+    Gaps (NaN) are skipped and repeated consecutive energies count as one state, as
+    in the plotted curves. Local maxima are transition states and every other point
+    is an intermediate. The span of a TS/intermediate pair is ``T - I`` when the TS
+    comes after the intermediate and ``T - I + reaction_energy`` otherwise; the
+    energetic span is the largest of these. Returns a dict of arrays, one value per
+    row; rows without a transition state get NaN and index -1.
+    """
+    values = np.array(matrix, dtype=float)
+    n, width = values.shape
+    index = np.broadcast_to(np.arange(width), values.shape).copy()
+
+    values, index = _compact(values, index)
+    repeat = np.zeros_like(values, dtype=bool)
+    repeat[:, 1:] = values[:, 1:] == values[:, :-1]
+    values[repeat] = np.nan
+    values, index = _compact(values, index)
+
+    valid = ~np.isnan(values)
+    length = valid.sum(axis=1)
+    rows = np.arange(n)
+    last = np.where(length > 0, length - 1, 0)
+    reaction_energy = np.where(length > 0, values[rows, last] - values[:, 0], np.nan)
+
+    # Transition states: strictly higher than both neighbours, as in the label placement
+    is_ts = np.zeros_like(valid)
+    if width > 2:
+        is_ts[:, 1:-1] = (values[:, 1:-1] > values[:, :-2]) & (values[:, 1:-1] > values[:, 2:])
+    is_int = valid & ~is_ts
+
+    # For each TS t the best intermediate is the lowest one before it (span T - I) or the
+    # lowest one after it (T - I + reaction_energy); running minima keep this O(n * width)
+    ts_e = np.where(is_ts, values, np.nan)
+    int_e = np.where(is_int, values, np.inf)
+    low_before, at_before = _running_min(int_e)
+    low_after, at_after = _running_min(int_e[:, ::-1], keep_last=True)
+    low_after, at_after = low_after[:, ::-1], np.where(at_after >= 0, width - 1 - at_after, -1)[:, ::-1]
+    span_before = ts_e - low_before
+    span_after = ts_e - low_after + reaction_energy[:, None]
+    span_before = np.where(np.isnan(span_before), -np.inf, span_before)
+    span_after = np.where(np.isnan(span_after), -np.inf, span_after)
+
+    # Ties go to the earlier TS and then to the earlier intermediate
+    use_after = span_after > span_before
+    span = np.where(use_after, span_after, span_before)
+    ts_pos = span.argmax(axis=1)
+    best = span[rows, ts_pos]
+    int_pos = np.where(use_after, at_after, at_before)[rows, ts_pos]
+    found = np.isfinite(best)
+    ts_pos, int_pos = np.where(found, ts_pos, 0), np.where(found, int_pos, 0)
+
+    energetic_span = np.where(found, best, np.nan)
+    tdts_energy = np.where(found, values[rows, ts_pos], np.nan)
+    tdi_energy = np.where(found, values[rows, int_pos], np.nan)
+
+    rt = GAS_CONSTANT.get(str(units).lower(), GAS_CONSTANT['kcal']) * float(temperature)
+    prefactor = BOLTZMANN * float(temperature) / PLANCK
+    return {
+        'energetic_span': energetic_span,
+        'tdi': np.where(found, index[rows, int_pos], -1),
+        'tdts': np.where(found, index[rows, ts_pos], -1),
+        'tdi_energy': tdi_energy,
+        'tdts_energy': tdts_energy,
+        'effective_barrier': tdts_energy - tdi_energy,
+        'reaction_energy': reaction_energy,
+        'tof': prefactor * np.exp(-energetic_span / rt),
+    }
+
+
+def energetic_span(energy_data, temperature=298.15, units='kcal'):
+    """Energetic span analysis for the same inputs ``plot()`` accepts.
+
+    All profiles are analysed in one vectorised pass. Returns ``{label: result}``
+    where each result holds ``energetic_span``, the TOF-determining intermediate
+    and transition state (``tdi``/``tdts`` as indices into the input list, and their
+    energies), ``effective_barrier`` (``tdts_energy - tdi_energy``),
+    ``reaction_energy`` (last minus first point) and ``tof`` in s^-1 at ``temperature``.
+    """
+    labels, profiles = _as_profiles(energy_data)
+    width = max((len(p) for p in profiles), default=0)
+    matrix = np.full((len(profiles), max(width, 1)), np.nan)
+    for i, profile in enumerate(profiles):
+        matrix[i, :len(profile)] = [np.nan if e is None else float(e) for e in profile]
+
+    arrays = energetic_span_matrix(matrix, temperature=temperature, units=units)
+    results = {}
+    for i, label in enumerate(labels):
+        result = {}
+        for key, values in arrays.items():
+            value = values[i].item()
+            if key in ('tdi', 'tdts'):
+                result[key] = None if value < 0 else int(value)
+            else:
+                result[key] = None if np.isnan(value) else value
+        results[label] = result
+    return results
+
+
+def write_results(results, path):
+    """Write :func:`energetic_span` results to ``path`` as CSV, or JSON for a ``.json`` path."""
+    if str(path).lower().endswith('.json'):
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2)
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for label, result in results.items():
+            writer.writerow({'label': label, **result})
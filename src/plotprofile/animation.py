@@ -0,0 +1,190 @@
+import logging
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.collections import LineCollection
+from matplotlib.text import Annotation
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class _BlitPillowWriter(PillowWriter):
+    """Grab the already blitted canvas buffer instead of re-rendering the whole figure."""
+
+    def grab_frame(self, **savefig_kwargs):
+        im = Image.frombuffer('RGBA', self.frame_size, self.fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        # Fast octree quantisation; the default median cut dominates the GIF write time
+        self._frames.append(im.convert('RGB').quantize(method=Image.Quantize.FASTOCTREE))
+
+
+class _BlitFFMpegWriter(FFMpegWriter):
+    """Pipe the already blitted canvas buffer to ffmpeg instead of re-rendering the whole figure."""
+
+    def grab_frame(self, **savefig_kwargs):
+        self._proc.stdin.write(self.fig.canvas.buffer_rgba())
+
+
+WRITERS = {
+    'gif': _BlitPillowWriter,
+    'mp4': _BlitFFMpegWriter,
+}
+
+
+def _artist_x(artist):
+    if isinstance(artist, Annotation):
+        return artist.xy[0]
+    if hasattr(artist, 'get_xdata'):
+        return float(np.mean(artist.get_xdata()))
+    if hasattr(artist, 'get_segments'):  # revealed once the front passes their right end
+        return max((float(np.max(np.asarray(seg)[:, 0])) for seg in artist.get_segments()), default=0.0)
+    return artist.get_position()[0]
+
+
+def _set_alpha(artist, alpha):
+    artist.set_alpha(alpha)
+    artist.set_visible(alpha > 0)
+    if isinstance(artist, Annotation):
+        if artist.arrow_patch is not None:
+            artist.arrow_patch.set_alpha(alpha)
+        if artist.get_bbox_patch() is not None:
+            artist.get_bbox_patch().set_alpha(alpha)
+
+
+class ProfileAnimation:
+    """Step-by-step reveal of a reaction profile on one persistent figure.
+
+    The figure is drawn once with :meth:`ReactionProfilePlotter.draw`. Each frame
+    moves a front along the reaction coordinate: curves are truncated with
+    ``set_data``, markers appear as the front reaches them, and energy labels,
+    point labels and segment annotations fade in over ``fade`` x-units.
+    """
+
+    def __init__(self, plotter, energy_data, frames=100, fade=0.5, **draw_kwargs):
+        self.plotter = plotter
+        self.fig, self.ax = plotter.draw(energy_data, **draw_kwargs)
+        self.frames = int(frames)
+        self.fade = float(fade)
+
+        artists = plotter._artists
+        self._curves = [
+            (line, np.asarray(line.get_xdata(), dtype=float), np.asarray(line.get_ydata(), dtype=float))
+            for line in artists['curves'].values()
+        ]
+        self._points = [(p, _artist_x(p)) for points in artists['points'].values() for p in points]
+        self._texts = [(t, _artist_x(t)) for _, t in artists['labels'] + artists['point_labels']]
+        # Segment annotations are [shafts, right heads, left heads] + one text per segment, in
+        # the same order. Each arrow fades in with its own text, at the segment's centre.
+        self._arrows = None
+        annotation_artists = plotter._annotation_artists
+        if annotation_artists and isinstance(annotation_artists[0], LineCollection):
+            shafts, right, left = annotation_artists[:3]
+            centers = np.array([np.mean(np.asarray(seg)[:, 0]) for seg in shafts.get_segments()])
+            colors = np.broadcast_to(shafts.get_colors(), (len(centers), 4)).copy()
+            heads = [(line, np.asarray(line.get_xdata(), dtype=float), np.asarray(line.get_ydata(), dtype=float))
+                     for line in (right, left)]
+            self._arrows = (shafts, colors, centers, heads)
+            annotation_artists = annotation_artists[3:]
+        self._texts += [(a, _artist_x(a)) for a in annotation_artists]
+
+        xs = [x for _, x in self._points] + [x for _, xs_, _ in self._curves for x in (xs_.min(), xs_.max())]
+        self.x_start = min(xs) if xs else 0.0
+        self.x_end = (max(xs) if xs else 1.0) + self.fade
+
+    @property
+    def artists(self):
+        arrows = [self._arrows[0]] + [line for line, _, _ in self._arrows[3]] if self._arrows else []
+        return [a for a, _, _ in self._curves] + [a for a, _ in self._points] + [a for a, _ in self._texts] + arrows
+
+    def _alpha(self, front, x):
+        """Opacity of artists revealed at ``x`` (a number or an array) when the front is at ``front``."""
+        if self.fade > 0:
+            return np.clip((front - np.asarray(x, dtype=float)) / self.fade, 0.0, 1.0)
+        return (np.asarray(x, dtype=float) <= front).astype(float)
+
+    def front(self, frame):
+        """Position of the reveal front on the reaction coordinate at ``frame``."""
+        if self.frames < 2:
+            return self.x_end
+        return self.x_start + (self.x_end - self.x_start) * frame / (self.frames - 1)
+
+    def update(self, frame):
+        """Show ``frame``; returns the artists that changed (for blitting)."""
+        front = self.front(frame)
+        for line, xs, ys in self._curves:
+            shown = xs <= front
+            line.set_data(xs[shown], ys[shown])
+        for point, x in self._points:
+            point.set_visible(x <= front + 1e-9)
+        for text, x in self._texts:
+            _set_alpha(text, float(self._alpha(front, x)))
+        if self._arrows:
+            shafts, colors, centers, heads = self._arrows
+            alpha = self._alpha(front, centers)
+            rgba = colors.copy()
+            rgba[:, 3] *= alpha
+            shafts.set_color(rgba)
+            # Head markers cannot fade one by one; show them once their shaft is half visible
+            for line, xs, ys in heads:
+                line.set_data(xs[alpha >= 0.5], ys[alpha >= 0.5])
+        return self.artists
+
+    def animation(self, interval=50, blit=True):
+        """Return a blitted :class:`~matplotlib.animation.FuncAnimation` for display."""
+        return FuncAnimation(
+            self.fig,
+            self.update,
+            frames=range(self.frames),
+            init_func=lambda: self.update(0),
+            interval=interval,
+            blit=blit,
+        )
+
+    def blitted_frames(self):
+        """Yield after rendering each frame into the canvas buffer.
+
+        The static parts (axes, legend, ...) are rendered once and restored as a
+        background; only the changing artists are drawn on top of it per frame.
+        """
+        canvas = self.fig.canvas
+        artists = self.artists
+        for artist in artists:
+            artist.set_animated(True)
+        try:
+            canvas.draw()
+            background = canvas.copy_from_bbox(self.fig.bbox)
+            for frame in range(self.frames):
+                canvas.restore_region(background)
+                for artist in self.update(frame):
+                    self.ax.draw_artist(artist)
+                yield frame
+        finally:
+            for artist in artists:
+                artist.set_animated(False)
+
+    def save(self, filename, fps=20, dpi=150):
+        """Save as GIF or MP4 (by extension of ``filename``) through matplotlib's writers."""
+        ext = filename.rsplit('.', 1)[-1].lower()
+        if ext not in WRITERS:
+            raise ValueError(f"Unsupported animation format '{ext}'; use {sorted(WRITERS)} or save_svg_frames().")
+        writer = WRITERS[ext](fps=fps)
+        with writer.saving(self.fig, filename, dpi):
+            self.fig.set_dpi(dpi)  # render the canvas at the frame size set up by the writer
+            for _ in self.blitted_frames():
+                writer.grab_frame()
+        logger.info(f"Wrote {self.frames} frames to {filename}")
+
+    def save_svg_frames(self, prefix):
+        """Write each frame to ``<prefix>_<frame>.svg``; returns the file names."""
+        names = []
+        for frame in range(self.frames):
+            self.update(frame)
+            name = f"{prefix}_{frame:04d}.svg"
+            self.plotter.save(self.fig, name, file_format='svg')
+            names.append(name)
+        return names
+
+    def close(self):
+        plt.close(self.fig)
@@ -0,0 +1,208 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+FORMAT_VERSION = 1
+
+# Files inside an archive directory
+ENERGIES = 'energies.npy'   # (n_series, n_points) float64, NaN padded, one row per series
+ROWS = 'rows.npy'           # (n_profiles, 2) int64 [start, stop) rows of each profile
+OFFSETS = 'offsets.npy'     # (n_profiles + 1,) int64 byte offsets into meta.jsonl
+META = 'meta.jsonl'         # one JSON line per profile: series labels, annotations, point labels
+KEYS = 'keys.json'          # {"version": 1, "keys": [profile keys in archive order]}
+
+
+def _split_entry(entry):
+    """Accept either plain energy data or the ``{"energies": ..., "annotations": ..., "point_labels": ...}`` envelope."""
+    if isinstance(entry, dict) and 'energies' in entry:
+        return entry['energies'], entry.get('annotations'), entry.get('point_labels')
+    return entry, None, None
+
+
+def _series(energy_data):
+    """Return ``(labels, series, single)`` for the layouts ``plot()`` accepts."""
+    if isinstance(energy_data, dict):
+        return list(energy_data.keys()), list(energy_data.values()), False
+    if isinstance(energy_data, list) and all(isinstance(s, list) for s in energy_data):
+        return None, energy_data, False
+    return None, [energy_data], True
+
+
+def write_archive(path, profiles):
+    """Write profiles to an archive directory at ``path``.
+
+    ``profiles`` is a dict of ``{key: energy_data or envelope}`` or an iterable of
+    ``(key, entry)`` pairs. Energy data uses any layout ``plot()`` accepts;
+    envelopes may also carry ``annotations`` and ``point_labels``.
+
+    Series are streamed to disk as they are read, so only the row table stays in
+    memory. The archive is built in a temporary directory next to ``path`` and
+    moved into place at the end; a failed pack leaves ``path`` as it was.
+    """
+    items = profiles.items() if isinstance(profiles, dict) else profiles
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=f".{os.path.basename(os.path.abspath(path))}.", dir=parent)
+    try:
+        _write_archive(tmp, items)
+        if os.path.exists(path):
+            old = tempfile.mkdtemp(prefix=f".{os.path.basename(os.path.abspath(path))}.old.", dir=parent)
+            os.replace(path, os.path.join(old, 'archive'))
+            os.replace(tmp, path)
+            shutil.rmtree(old)
+        else:
+            os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def _write_archive(path, items):
+    keys, rows, lengths = [], [], []
+    offsets = [0]
+    raw_path = os.path.join(path, 'energies.raw')
+    with open(os.path.join(path, META), 'wb') as meta, open(raw_path, 'wb') as raw:
+        for key, entry in items:
+            energy_data, annotations, point_labels = _split_entry(entry)
+            labels, values, single = _series(energy_data)
+            try:
+                block = [np.asarray([np.nan if e is None else float(e) for e in series], dtype=np.float64) for series in values]
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Profile '{key}' has a non-numeric energy: {e}") from e
+            rows.append((len(lengths), len(lengths) + len(values)))
+            for series in block:
+                raw.write(series.tobytes())
+                lengths.append(len(series))
+            line = json.dumps({
+                'labels': labels,
+                'single': single,
+                'annotations': annotations,
+                'point_labels': point_labels,
+            }).encode('utf-8') + b'\n'
+            meta.write(line)
+            offsets.append(offsets[-1] + len(line))
+            keys.append(str(key))
+
+    # Copy the streamed series into the NaN-padded block one row at a time
+    width = max(lengths, default=0)
+    energies = np.lib.format.open_memmap(os.path.join(path, ENERGIES), mode='w+', dtype=np.float64,
+                                         shape=(len(lengths), max(width, 1)))
+    energies[:] = np.nan
+    with open(raw_path, 'rb') as raw:
+        for i, n in enumerate(lengths):
+            energies[i, :n] = np.frombuffer(raw.read(8 * n), dtype=np.float64)
+    energies.flush()
+    del energies
+    os.remove(raw_path)
+
+    np.save(os.path.join(path, ROWS), np.asarray(rows, dtype=np.int64).reshape(-1, 2))
+    np.save(os.path.join(path, OFFSETS), np.asarray(offsets, dtype=np.int64))
+    with open(os.path.join(path, KEYS), 'w') as f:
+        json.dump({'version': FORMAT_VERSION, 'keys': keys}, f)
+
+
+def json_to_archive(paths, archive_path, keys=None):
+    """Pack CLI-style JSON input files into an archive; keys default to the file names without extension."""
+    keys = keys or [os.path.splitext(os.path.basename(p))[0] for p in paths]
+    if len(keys) != len(paths):
+        raise ValueError(f"Got {len(keys)} keys for {len(paths)} files.")
+
+    def entries():
+        # Read lazily; write_archive streams each file's series to disk
+        for key, p in zip(keys, paths):
+            with open(p, 'r') as f:
+                try:
+                    entry = json.load(f)
+                except ValueError as e:
+                    raise ValueError(f"{p} is not valid JSON: {e}") from e
+            yield key, entry
+
+    write_archive(archive_path, entries())
+
+
+class ProfileArchive:
+    """Random-access reader for an archive written by :func:`write_archive`.
+
+    The energy block, row table and metadata offsets are memory-mapped, so reading a
+    few profiles only touches their own rows and metadata lines.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, KEYS), 'r') as f:
+            header = json.load(f)
+        if header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive version {header.get('version')} in '{path}'.")
+        self._keys = header['keys']
+        self._index = {k: i for i, k in enumerate(self._keys)}
+        self.energies = np.load(os.path.join(path, ENERGIES), mmap_mode='r')
+        self.rows = np.load(os.path.join(path, ROWS), mmap_mode='r')
+        self.offsets = np.load(os.path.join(path, OFFSETS), mmap_mode='r')
+        self._meta = open(os.path.join(path, META), 'rb')
+
+    def close(self):
+        self._meta.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def keys(self):
+        return list(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def _metadata(self, i):
+        start, stop = int(self.offsets[i]), int(self.offsets[i + 1])
+        self._meta.seek(start)
+        return json.loads(self._meta.read(stop - start))
+
+    def __getitem__(self, key):
+        """Return ``{"energies": ..., "annotations": ..., "point_labels": ...}`` for ``key``, ready for ``plot()``."""
+        if key not in self._index:
+            raise KeyError(key)
+        i = self._index[key]
+        meta = self._metadata(i)
+        start, stop = self.rows[i]
+        series = []
+        for row in np.asarray(self.energies[start:stop]):
+            valid = np.nonzero(~np.isnan(row))[0]
+            end = valid[-1] + 1 if len(valid) else 0
+            series.append([None if np.isnan(e) else e for e in row[:end].tolist()])
+
+        if meta['labels'] is not None:
+            energies = dict(zip(meta['labels'], series))
+        elif meta['single']:
+            energies = series[0]
+        else:
+            energies = series
+        return {
+            'energies': energies,
+            'annotations': meta['annotations'],
+            'point_labels': meta['point_labels'],
+        }
+
+    def missing(self, keys):
+        """Return the ``keys`` that are not in the archive."""
+        return [k for k in keys if k not in self._index]
+
+    def get_many(self, keys):
+        """Return ``{key: profile}`` for the selected keys, reading them in on-disk order.
+
+        The result is ordered as the keys are stored, not as given. Raises ``KeyError``
+        naming every key that is not in the archive.
+        """
+        missing = self.missing(keys)
+        if missing:
+            raise KeyError(f"Not in archive '{self.path}': {', '.join(map(str, missing))}")
+        order = sorted(keys, key=self._index.get)
+        return {k: self[k] for k in order}
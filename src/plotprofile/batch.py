@@ -0,0 +1,370 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+from .server import KILL_GRACE, _on_alarm
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+BatchResult = namedtuple('BatchResult', [
+    'key',           # job key
+    'target',        # output path
+    'ok',            # True if the render succeeded
+    'error',         # error message, or None
+    'seconds',       # wall time of the render
+    'written',       # False if skip_unchanged left the file untouched
+    'traced_peak_mb',  # peak Python allocations during the render (tracemalloc), or None
+    'rss_peak_mb',   # peak resident set size of the worker sampled during the render
+    'worker',        # pid of the worker that rendered it
+])
+
+
+def _rss_mb():
+    """Current resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        # No procfs (e.g. macOS): fall back to the high-water mark, reported in bytes there
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+class _RssSampler:
+    """Sample the RSS on a background thread and keep the maximum seen."""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = _rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss_mb())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss_mb())
+
+
+# --- worker side
+
+def _worker_main(conn, max_renders, max_memory_mb, timeout, trace_memory):
+    """Render jobs received on ``conn`` until a budget runs out, then exit so the runner starts a fresh worker."""
+    import matplotlib.pyplot as plt
+    from .server import _init_worker, _render
+
+    _init_worker()
+    conn.send(os.getpid())  # ready; job time limits start counting from here
+    alarm = hasattr(signal, 'SIGALRM') and timeout
+    if alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+    if trace_memory:
+        tracemalloc.start()
+
+    renders = 0
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        key, payload, target, options = job
+
+        error, written, traced = None, False, None
+        if trace_memory:
+            # reset_peak() is Python 3.9+; clearing the traces also resets the peak
+            tracemalloc.reset_peak() if hasattr(tracemalloc, 'reset_peak') else tracemalloc.clear_traces()
+        start = time.perf_counter()
+        with _RssSampler() as rss:
+            try:
+                if alarm:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                written = _render(payload, options, target=target)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                if alarm:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+                # A failed render can leave its figure behind
+                plt.close('all')
+        seconds = time.perf_counter() - start
+        if trace_memory:
+            traced = tracemalloc.get_traced_memory()[1] / 2**20
+        renders += 1
+
+        recycle = renders >= max_renders or (max_memory_mb is not None and _rss_mb() > max_memory_mb)
+        conn.send((error, written, seconds, traced, rss.peak, recycle))
+        if recycle:
+            return
+
+
+# --- runner side
+
+class _Worker:
+    def __init__(self, ctx, budgets):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child,) + budgets, daemon=True)
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.job = None
+        self.deadline = None
+
+    def send(self, job, timeout):
+        self.job = job
+        self.deadline = None
+        if self.ready:
+            self.start_clock(timeout)
+        self.conn.send(job)
+
+    def start_clock(self, timeout):
+        if timeout:
+            self.deadline = time.monotonic() + timeout + KILL_GRACE
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join(KILL_GRACE)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class BatchRunner:
+    """Render many profiles in worker processes that are recycled before they grow too large.
+
+    Each worker is started like the render server's (matplotlib imported, styles
+    and fonts loaded once) and renders jobs one at a time, closing every figure
+    afterwards. A worker exits and is replaced after ``max_renders`` renders, or
+    as soon as its RSS exceeds ``max_memory_mb`` after a render, so caches and
+    leaked figures cannot accumulate over a long run. A render running longer
+    than ``timeout`` seconds fails with a ``TimeoutError``; a worker stuck past
+    that (e.g. inside the renderer) is killed and replaced, and so is one that
+    dies, e.g. by the OOM killer. Either way only the job it was running fails.
+
+    Every job yields a :class:`BatchResult` with the render time and the peak
+    memory seen during the render: the worker's RSS, sampled every 10 ms, and
+    with ``trace_memory=True`` the Python allocations traced by tracemalloc
+    (this makes rendering several times slower, so it is off by default).
+    """
+
+    def __init__(self, workers=None, max_renders=500, max_memory_mb=None, timeout=60.0, trace_memory=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_renders = max_renders
+        self.max_memory_mb = max_memory_mb
+        self.timeout = timeout
+        self.trace_memory = trace_memory
+        self.recycled = 0
+        self._ctx = multiprocessing.get_context('spawn')
+
+    def _spawn(self):
+        return _Worker(self._ctx, (self.max_renders, self.max_memory_mb, self.timeout, self.trace_memory))
+
+    def run(self, jobs, **options):
+        """Render ``jobs`` and yield a :class:`BatchResult` for each, in completion order.
+
+        ``jobs`` is an iterable of ``(key, payload, target)``; ``payload`` is the
+        JSON the CLI reads from ``--input`` or the ``{"energies": ..., ...}``
+        envelope, and ``target`` the output path. It is read lazily, so very long
+        runs never hold every job in memory. A job whose input could not be read
+        passes the exception as its ``payload`` and is reported as failed. ``options`` mirror the render
+        server's: ``format``, ``style``, ``dpi``, ``include``, ``dashed``, plus
+        ``overrides``, a dict of style keys.
+        """
+        jobs = iter(jobs)
+        workers = []
+        unreadable = []
+
+        def assign(worker):
+            for key, payload, target in jobs:
+                if isinstance(payload, Exception):
+                    unreadable.append(BatchResult(key, target, False, f"{type(payload).__name__}: {payload}",
+                                                  None, False, None, None, None))
+                    continue
+                worker.send((key, payload, target, options), self.timeout)
+                return
+            worker.job = None
+
+        def drain():
+            while unreadable:
+                result = unreadable.pop(0)
+                logger.warning(f"{result.key} failed: {result.error}")
+                yield result
+
+        def failed(worker, error):
+            key, _, target, _ = worker.job
+            return BatchResult(key, target, False, error, None, False, None, None, worker.process.pid)
+
+        try:
+            for _ in range(self.workers):
+                worker = self._spawn()
+                workers.append(worker)
+                assign(worker)
+                yield from drain()
+
+            while any(w.job is not None for w in workers):
+                busy = [w for w in workers if w.job is not None]
+                deadlines = [w.deadline for w in busy if w.deadline is not None]
+                wait_for = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                ready = set(wait([w.conn for w in busy] + [w.process.sentinel for w in busy], timeout=wait_for))
+
+                for i, worker in enumerate(workers):
+                    if worker.job is None:
+                        continue
+                    result, replace, kill = None, False, False
+                    if worker.conn in ready and not worker.ready:
+                        try:
+                            worker.conn.recv()
+                        except (EOFError, OSError):
+                            result, replace = failed(worker, f"worker exited with code {worker.process.exitcode}"), True
+                        else:
+                            worker.ready = True
+                            worker.start_clock(self.timeout)
+                    elif worker.conn in ready:
+                        try:
+                            error, written, seconds, traced, rss, recycle = worker.conn.recv()
+                        except (EOFError, OSError):
+                            result, replace = failed(worker, f"worker exited with code {worker.process.exitcode}"), True
+                        else:
+                            key, _, target, _ = worker.job
+                            result = BatchResult(key, target, error is None, error, seconds, written, traced, rss, worker.process.pid)
+                            replace = recycle
+                    elif worker.process.sentinel in ready:
+                        worker.process.join()
+                        result, replace = failed(worker, f"worker exited with code {worker.process.exitcode}"), True
+                    elif worker.deadline is not None and time.monotonic() >= worker.deadline:
+                        result = failed(worker, f"TimeoutError: render exceeded {self.timeout} s; worker killed")
+                        replace = kill = True
+
+                    if result is None:
+                        continue
+                    if result.ok:
+                        logger.debug(f"{result.key}: {result.seconds:.2f} s, RSS peak {result.rss_peak_mb:.0f} MB")
+                    else:
+                        logger.warning(f"{result.key} failed: {result.error}")
+                    if replace:
+                        worker.stop(kill=kill)
+                        self.recycled += 1
+                        worker = workers[i] = self._spawn()
+                    assign(worker)
+                    yield result
+                    yield from drain()
+        finally:
+            for worker in workers:
+                worker.stop()
+
+
+def _archive_jobs(path, output, file_format, keys=None):
+    from .archive import ProfileArchive
+
+    with ProfileArchive(path) as archive:
+        for key in keys or archive.keys():
+            target = f"{output}_{key.replace(os.sep, '_')}.{file_format}"
+            try:
+                profile = archive[key]
+            except Exception as e:
+                profile = e  # reported as a failed job; the run goes on
+            yield key, profile, target
+
+
+def _json_jobs(paths, output, file_format):
+    for p in paths:
+        key = os.path.splitext(os.path.basename(p))[0]
+        try:
+            with open(p, 'r') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            payload = e  # reported as a failed job; the run goes on
+        yield key, payload, f"{output}_{key}.{file_format}"
+
+
+def batch_main(argv=None):
+    parser = argparse.ArgumentParser(prog='plotprofile batch', description="Render many profiles in memory-bounded, recycled worker processes")
+    parser.add_argument('inputs', nargs='*', help='JSON files in the --input layout (or the {"energies": ...} envelope)')
+    parser.add_argument('--archive', type=str, help='Render profiles from an archive made with "plotprofile pack"')
+    parser.add_argument('--keys', type=str, nargs='+', help='Archive keys to render (default: all)')
+    parser.add_argument('--output', type=str, default='reaction_profile', help='Output prefix; files are written as <output>_<key>.<format>')
+    parser.add_argument('--format', type=str, default='png', choices=['eps', 'png', 'svg', 'pdf'])
+    parser.add_argument('--style', type=str, default='default', help='Style preset (default, presentation, etc.)')
+    parser.add_argument('--dpi', type=int, default=600, help='Resolution for raster formats')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--max-renders', type=int, default=500, help='Renders per worker before it is recycled')
+    parser.add_argument('--max-memory', type=float, help='Recycle a worker once its RSS exceeds this many MB')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-render time limit in seconds')
+    parser.add_argument('--trace', action='store_true', help='Also trace Python allocations with tracemalloc (slower)')
+    parser.add_argument('--report', type=str, help='Write one JSON line of timing and memory per render to this file')
+    parser.add_argument('--reproducible', action='store_true', help='Write byte-identical files for identical input')
+    parser.add_argument('--skip-unchanged', action='store_true', help='Leave output files untouched if their content would not change (implies --reproducible)')
+    args = parser.parse_args(argv)
+    if not args.inputs and not args.archive:
+        parser.error("give input JSON files or --archive")
+
+    if args.archive and args.keys:
+        from .archive import ProfileArchive
+        with ProfileArchive(args.archive) as archive:
+            missing = archive.missing(args.keys)
+        if missing:
+            parser.error(f"keys not in archive {args.archive}: {', '.join(missing)}")
+
+    logging.basicConfig(level=logging.INFO)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    jobs = _archive_jobs(args.archive, args.output, args.format, args.keys) if args.archive else \
+        _json_jobs(args.inputs, args.output, args.format)
+    options = {
+        'format': args.format,
+        'style': args.style,
+        'dpi': args.dpi,
+        'overrides': {'reproducible': args.reproducible, 'skip_unchanged': args.skip_unchanged},
+    }
+
+    runner = BatchRunner(
+        workers=args.workers,
+        max_renders=args.max_renders,
+        max_memory_mb=args.max_memory,
+        timeout=args.timeout,
+        trace_memory=args.trace,
+    )
+    done = failed = 0
+    start = time.monotonic()
+    report = open(args.report, 'w') if args.report else None
+    try:
+        for result in runner.run(jobs, **options):
+            done += 1
+            failed += not result.ok
+            if report:
+                report.write(json.dumps(result._asdict()) + '\n')
+            if done % 1000 == 0:
+                logger.info(f"{done} profiles rendered ({failed} failed), {done / (time.monotonic() - start):.1f}/s")
+    finally:
+        if report:
+            report.close()
+    logger.info(f"Rendered {done - failed} of {done} profiles in {time.monotonic() - start:.1f} s "
+                f"({failed} failed, {runner.recycled} workers recycled).")
+    return 1 if failed else 0
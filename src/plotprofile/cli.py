@@ -1,12 +1,51 @@
 import argparse
 import json
+import os
+import sys
 import numpy as np
 from .plot import ReactionProfilePlotter
 
 
-def main():
+def _load_energy_json(path):
+    with open(path, 'r') as f:
+        energy_dict = json.load(f)
+
+    # Convert 'null' to np.nan
+    for key in energy_dict:
+        energy_dict[key] = [e if e is not None else np.nan for e in energy_dict[key]]
+    return energy_dict
+
+
+def _load_grid_json(path):
+    with open(path, 'r') as f:
+        panels = json.load(f)
+
+    for panel in panels.values():
+        for key in panel:
+            panel[key] = [e if e is not None else np.nan for e in panel[key]]
+    return panels
+
+
+def _load_json(path):
+    if not path:
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'serve':
+        from .server import serve_main
+        return serve_main(argv[1:])
+    if argv and argv[0] == 'pack':
+        return pack_main(argv[1:])
+    if argv and argv[0] == 'batch':
+        from .batch import batch_main
+        return batch_main(argv[1:])
+
     parser = argparse.ArgumentParser(description="Plot reaction profile from labeled energy data")
-    parser.add_argument('--input', type=str, required=True, help='Path to JSON file with energy dict')
+    parser.add_argument('--input', type=str, help='Path to JSON file with energy dict (or .csv/.tsv/.npy with --input-units)')
     parser.add_argument('--output', type=str, default='reaction_profile', help='Output filename (no extension)')
     parser.add_argument('--format', type=str, default='png', choices=['eps', 'png', 'svg', 'pdf'])
     parser.add_argument('--style', type=str, default='default', 
@@ -31,21 +70,77 @@ def main():
                        help='Which axes to show - overrides style')
     parser.add_argument('--annotations', type=str, 
                        help='Path to JSON file with segment annotations')
+    parser.add_argument('--style-file', type=str,
+                       help='Path to JSON file of style parameters - overrides style')
+    parser.add_argument('--grid', action='store_true',
+                       help='Input is a JSON dict of {panel title: energy dict}; draw all panels in one figure')
+    parser.add_argument('--ncols', type=int,
+                       help='Number of panel columns for --grid')
+    parser.add_argument('--sharey', action='store_true',
+                       help='Use the same y-limits for every --grid panel')
+    parser.add_argument('--ensemble', action='store_true',
+                       help='Input positions hold lists of conformer energies; plot Boltzmann-weighted profiles with envelope bands')
+    parser.add_argument('--network', action='store_true',
+                       help='Input JSON is a reaction network: {"states": {state: energy}, "pathways": {label: [states]}}')
+    parser.add_argument('--temperature', type=float, default=298.15,
+                       help='Temperature in K for --ensemble weighting')
+    parser.add_argument('--input-units', type=str, choices=['hartree', 'ev', 'kj', 'kcal'],
+                       help='Input holds absolute energies in these units; convert and reference them')
+    parser.add_argument('--reference', type=str,
+                       help="Reference for --input-units: first (default), min, none, INDEX or LABEL:INDEX (global)")
+    parser.add_argument('--names', nargs='*', type=str,
+                       help='Profile names for rows of a .npy input')
+    parser.add_argument('--archive', type=str,
+                       help='Render profiles from an archive made with "plotprofile pack" instead of --input')
+    parser.add_argument('--keys', nargs='*', type=str,
+                       help='Archive keys to render (default: all), in archive order; written to <output>_<key>.<format>')
+    parser.add_argument('--analysis', type=str,
+                       help='Write energetic span analysis to this CSV (or .json) file')
+    parser.add_argument('--mark-span', action='store_true',
+                       help='Mark the energetic span (TDI to TDTS) on the plot')
+    parser.add_argument('--watch', action='store_true',
+                       help='Re-render whenever the input, annotations or style file changes')
+    parser.add_argument('--watch-interval', type=float, default=0.5,
+                       help='Polling interval in seconds for --watch')
+    parser.add_argument('--reproducible', action='store_true',
+                       help='Byte-reproducible output: fixed SVG ids, no dates or versions in the metadata')
+    parser.add_argument('--skip-unchanged', action='store_true',
+                       help='Do not rewrite output files whose content would be identical (implies --reproducible)')
+    parser.add_argument('--animate', type=str, choices=['gif', 'mp4', 'svg'],
+                       help='Write a step-by-step reveal animation instead of a still (svg: <output>_NNNN.svg frames)')
+    parser.add_argument('--frames', type=int, default=100,
+                       help='Number of frames for --animate')
+    parser.add_argument('--fps', type=int, default=20,
+                       help='Frames per second for --animate')
 
-    args = parser.parse_args()
-
-    with open(args.input, 'r') as f:
-        energy_dict = json.load(f)
-
-    # Convert 'null' to np.nan
-    for key in energy_dict:
-        energy_dict[key] = [e if e is not None else np.nan for e in energy_dict[key]]
-
-    # Load annotations if provided
-    segment_annotations = None
-    if args.annotations:
-        with open(args.annotations, 'r') as f:
-            segment_annotations = json.load(f)
+    args = parser.parse_args(argv)
+    if not args.input and not args.archive:
+        parser.error("one of --input or --archive is required")
+    for flag, mode in [('--grid', args.grid), ('--ensemble', args.ensemble), ('--archive', args.archive)]:
+        if mode and args.analysis:
+            parser.error(f"--analysis cannot be combined with {flag}")
+        if mode and args.mark_span:
+            parser.error(f"--mark-span cannot be combined with {flag}")
+    for flag, mode in [('--grid', args.grid), ('--ensemble', args.ensemble), ('--network', args.network), ('--archive', args.archive)]:
+        if mode and args.animate:
+            parser.error(f"--animate cannot be combined with {flag}")
+        if mode and args.input_units:
+            parser.error(f"--input-units cannot be combined with {flag}")
+    if not args.input_units:
+        if args.reference is not None:
+            parser.error("--reference requires --input-units")
+        if args.names is not None:
+            parser.error("--names requires --input-units")
+    if args.watch:
+        # The watcher re-renders plain JSON energy input only
+        unsupported = [
+            ('--grid', args.grid), ('--ensemble', args.ensemble), ('--network', args.network),
+            ('--input-units', args.input_units), ('--mark-span', args.mark_span), ('--archive', args.archive),
+            ('--analysis', args.analysis), ('--animate', args.animate),
+        ]
+        for flag, value in unsupported:
+            if value:
+                parser.error(f"--watch cannot be combined with {flag}")
 
     # Prepare style kwargs
     style_kwargs = {
@@ -67,22 +162,145 @@ def main():
         style_kwargs['desaturate_factor'] = args.desaturate_factor
     if args.axes:
         style_kwargs['axes'] = args.axes if args.axes != 'none' else None
-    if segment_annotations:
-        style_kwargs['segment_annotations'] = segment_annotations
+    if args.reproducible:
+        style_kwargs['reproducible'] = True
+    if args.skip_unchanged:
+        style_kwargs['skip_unchanged'] = True
 
-    plotter = ReactionProfilePlotter(**style_kwargs)
+    if args.watch:
+        from .watch import ProfileWatcher
+        watcher = ProfileWatcher(
+            args.input,
+            args.output,
+            file_format=args.format,
+            annotations_path=args.annotations,
+            style_file=args.style_file,
+            style_kwargs=style_kwargs,
+            dashed=args.dashed,
+            include_keys=args.include,
+            interval=args.watch_interval,
+        )
+        return watcher.run()
+
+    segment_annotations = _load_json(args.annotations)
+
+    plotter = ReactionProfilePlotter(**{**(_load_json(args.style_file) or {}), **style_kwargs})
 
     # Handle dashed series
     if args.dashed:
         plotter.dashed = args.dashed
 
+    if args.archive:
+        from .archive import ProfileArchive
+        template = plotter.template()
+        with ProfileArchive(args.archive) as archive:
+            keys = args.keys if args.keys else archive.keys()
+            missing = archive.missing(keys)
+            if missing:
+                parser.error(f"keys not in archive {args.archive}: {', '.join(missing)}")
+            for key, profile in archive.get_many(keys).items():
+                template.render(
+                    profile['energies'],
+                    f"{args.output}_{key.replace(os.sep, '_')}",
+                    file_format=args.format,
+                    annotations=profile['annotations'],
+                    point_labels=profile['point_labels'],
+                    include_keys=args.include,
+                )
+        return
+
+    if args.grid:
+        plotter.plot_grid(
+            _load_grid_json(args.input),
+            filename=args.output,
+            file_format=args.format,
+            annotations=segment_annotations,
+            ncols=args.ncols,
+            sharey=args.sharey,
+            include_keys=args.include,
+        )
+        return
+
+    if args.ensemble:
+        plotter.plot_ensemble(
+            _load_json(args.input),
+            temperature=args.temperature,
+            filename=args.output,
+            file_format=args.format,
+            annotations=segment_annotations,
+            include_keys=args.include,
+        )
+        return
+
+    if args.network:
+        network = _load_json(args.input)
+        if args.analysis:
+            from .analysis import energetic_span, write_results
+            from .network import pathway_energies
+            profiles = {k: v for k, v in pathway_energies(network).items() if args.include is None or k in args.include}
+            write_results(energetic_span(profiles, units=plotter.units), args.analysis)
+        plotter.plot_network(
+            network,
+            filename=args.output,
+            file_format=args.format,
+            annotations=segment_annotations,
+            label_states=True,
+            include_keys=args.include,
+            mark_span=args.mark_span,
+        )
+        return
+
+    if args.input_units:
+        from .ingest import load_energies, parse_reference
+        energy_dict = load_energies(
+            args.input,
+            units=args.input_units,
+            to_units=plotter.units,
+            reference=parse_reference(args.reference or 'first'),
+            labels=args.names,
+        )
+    else:
+        energy_dict = _load_energy_json(args.input)
+
+    if args.analysis:
+        from .analysis import energetic_span, write_results
+        profiles = {k: v for k, v in energy_dict.items() if args.include is None or k in args.include}
+        write_results(energetic_span(profiles, units=plotter.units), args.analysis)
+
+    if args.animate:
+        plotter.animate(
+            energy_dict,
+            args.output if args.animate == 'svg' else f"{args.output}.{args.animate}",
+            frames=args.frames,
+            fps=args.fps,
+            annotations=segment_annotations,
+            include_keys=args.include,
+            mark_span=args.mark_span,
+        )
+        return
+
     plotter.plot(
         energy_dict, 
         filename=args.output, 
         file_format=args.format, 
-        include_keys=args.include
+        annotations=segment_annotations,
+        include_keys=args.include,
+        mark_span=args.mark_span,
     )
 
 
+def pack_main(argv=None):
+    parser = argparse.ArgumentParser(prog='plotprofile pack', description="Pack JSON profile files into an indexed archive")
+    parser.add_argument('inputs', nargs='+', help='JSON files in the --input layout (or the {"energies": ...} envelope)')
+    parser.add_argument('--output', type=str, required=True, help='Archive directory to write')
+    args = parser.parse_args(argv)
+
+    from .archive import json_to_archive
+    try:
+        json_to_archive(args.inputs, args.output)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,90 @@
+import warnings
+
+import numpy as np
+
+# Gas constant in the units understood by the `units` style key
+GAS_CONSTANT = {
+    'kcal': 1.987204259e-3,  # kcal/mol/K
+    'kj': 8.314462618e-3,    # kJ/mol/K
+}
+
+METHODS = ('boltzmann', 'weighted_mean', 'min')
+
+
+def _conformer_matrix(positions):
+    """Stack ragged conformer lists into a NaN-padded ``(n_positions, max_conformers)`` array."""
+    rows = []
+    for entry in positions:
+        if entry is None:
+            rows.append(np.empty(0))
+        else:
+            rows.append(np.atleast_1d(np.asarray(entry, dtype=float)).ravel())
+    width = max((len(r) for r in rows), default=0)
+    matrix = np.full((len(rows), max(width, 1)), np.nan)
+    for i, r in enumerate(rows):
+        matrix[i, :len(r)] = r
+    return matrix
+
+
+def aggregate_conformers(matrix, temperature=298.15, units='kcal', method='boltzmann', band='minmax'):
+    """Reduce a NaN-padded conformer matrix row by row.
+
+    Returns ``(energy, lower, upper)`` arrays with one value per row (NaN for empty rows).
+    ``method`` is ``'boltzmann'`` (ensemble free energy, -RT ln sum exp(-E/RT)),
+    ``'weighted_mean'`` (Boltzmann-weighted average energy) or ``'min'``.
+    ``band`` is ``'minmax'`` or a ``(low, high)`` pair of percentiles, widened where
+    needed to include ``energy``: the Boltzmann free energy lies below the lowest
+    conformer, and a percentile band need not contain the weighted mean.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown ensemble method '{method}'; choose from {METHODS}.")
+    rt = GAS_CONSTANT.get(str(units).lower(), GAS_CONSTANT['kcal']) * float(temperature)
+    matrix = np.asarray(matrix, dtype=float)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN rows give NaN
+        lowest = np.nanmin(matrix, axis=1)
+        weights = np.exp(-(matrix - lowest[:, None]) / rt)  # NaN padding stays NaN
+        total = np.nansum(weights, axis=1)
+        if method == 'boltzmann':
+            energy = lowest - rt * np.log(total)
+        elif method == 'weighted_mean':
+            energy = np.nansum(weights * matrix, axis=1) / total
+        else:
+            energy = lowest
+
+        if band == 'minmax':
+            lower, upper = lowest, np.nanmax(matrix, axis=1)
+        else:
+            lower, upper = np.nanpercentile(matrix, list(band), axis=1)
+        lower, upper = np.fmin(lower, energy), np.fmax(upper, energy)
+
+    empty = np.isnan(lowest)
+    energy[empty] = np.nan
+    return energy, lower, upper
+
+
+def reduce_ensembles(ensemble_data, temperature=298.15, units='kcal', method='boltzmann', band='minmax'):
+    """Reduce ``{label: [conformer energies per position]}`` to plottable profiles.
+
+    Each position holds a list of conformer energies, a single number or ``None``.
+    All positions of all profiles are reduced in one vectorised pass. Returns
+    ``(energies, lower, upper)`` dicts of lists with ``None`` for missing positions,
+    in the same layout :meth:`ReactionProfilePlotter.plot` accepts.
+    """
+    if not isinstance(ensemble_data, dict):
+        raise TypeError("Ensemble input must be a dict of {label: [conformer energies per position]}.")
+
+    labels = list(ensemble_data.keys())
+    lengths = [len(ensemble_data[k]) for k in labels]
+    matrix = _conformer_matrix([entry for k in labels for entry in ensemble_data[k]])
+    energy, lower, upper = aggregate_conformers(matrix, temperature, units, method, band)
+
+    def split(values):
+        out, start = {}, 0
+        for label, n in zip(labels, lengths):
+            out[label] = [None if np.isnan(v) else float(v) for v in values[start:start + n]]
+            start += n
+        return out
+
+    return split(energy), split(lower), split(upper)
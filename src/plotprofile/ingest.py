@@ -0,0 +1,149 @@
+import csv
+import json
+import os
+
+import numpy as np
+
+# Conversion factors to kcal/mol
+TO_KCAL = {
+    'hartree': 627.509474,
+    'ev': 23.0605478,
+    'kj': 1 / 4.184,
+    'kcal': 1.0,
+}
+
+UNIT_ALIASES = {
+    'eh': 'hartree', 'au': 'hartree', 'ha': 'hartree',
+    'kj/mol': 'kj', 'kcal/mol': 'kcal',
+}
+
+
+def _unit(name):
+    key = str(name).lower()
+    key = UNIT_ALIASES.get(key, key)
+    if key not in TO_KCAL:
+        raise ValueError(f"Unknown energy unit '{name}'; choose from {sorted(TO_KCAL)}.")
+    return key
+
+
+def conversion_factor(from_units, to_units='kcal'):
+    """Multiplier converting energies in ``from_units`` to ``to_units`` (hartree, ev, kj or kcal)."""
+    return TO_KCAL[_unit(from_units)] / TO_KCAL[_unit(to_units)]
+
+
+def _read_table(path, delimiter):
+    with open(path, 'r', newline='') as f:
+        rows = [row for row in csv.reader(f, delimiter=delimiter) if row]
+    labels = [h.strip() for h in rows[0]]
+    matrix = np.full((len(labels), len(rows) - 1), np.nan)
+    for j, row in enumerate(rows[1:]):
+        for i, cell in enumerate(row[:len(labels)]):
+            cell = cell.strip()
+            if cell and cell.lower() not in ('nan', 'null', 'none'):
+                matrix[i, j] = float(cell)
+    return labels, matrix
+
+
+def _profiles_to_matrix(profiles):
+    width = max((len(p) for p in profiles), default=0)
+    matrix = np.full((len(profiles), max(width, 1)), np.nan)
+    for i, profile in enumerate(profiles):
+        matrix[i, :len(profile)] = [np.nan if e is None else float(e) for e in profile]
+    return matrix
+
+
+def read_energy_matrix(source, labels=None, mmap=True):
+    """Read absolute energies as ``(labels, matrix)`` with one NaN-padded row per profile.
+
+    ``source`` may be a dict of ``{label: [energies]}``, a 2D array, a pandas
+    DataFrame (one column per profile), or a path to a ``.json`` file (CLI input
+    layout), a ``.csv``/``.tsv`` file (header row of labels, one column per profile)
+    or a ``.npy`` array (one row per profile, memory-mapped when ``mmap`` is true).
+    ``labels`` names the rows of unlabelled array inputs.
+    """
+    if isinstance(source, dict):
+        return list(source.keys()), _profiles_to_matrix(list(source.values()))
+    if hasattr(source, 'columns') and hasattr(source, 'to_numpy'):  # pandas DataFrame
+        return [str(c) for c in source.columns], source.to_numpy(dtype=float, na_value=np.nan).T
+    if isinstance(source, np.ndarray):
+        matrix = np.atleast_2d(source)
+    elif isinstance(source, (str, os.PathLike)):
+        ext = os.path.splitext(str(source))[1].lower()
+        if ext == '.json':
+            with open(source, 'r') as f:
+                return read_energy_matrix(json.load(f))
+        if ext in ('.csv', '.tsv', '.txt'):
+            return _read_table(source, '\t' if ext == '.tsv' else ',')
+        if ext == '.npy':
+            matrix = np.atleast_2d(np.load(source, mmap_mode='r' if mmap else None))
+        else:
+            raise ValueError(f"Unsupported energy file type '{ext}'; use .json, .csv, .tsv or .npy.")
+    else:
+        raise TypeError(f"Unsupported energy source: {type(source)}")
+
+    if labels is None:
+        labels = [f"_unlabeled_{i}" for i in range(len(matrix))]
+    elif len(labels) != len(matrix):
+        raise ValueError(f"Got {len(labels)} labels for {len(matrix)} profiles.")
+    return list(labels), matrix
+
+
+def relative_energies(matrix, labels, units='hartree', to_units='kcal', reference='first'):
+    """Convert units and subtract the reference in one vectorised operation.
+
+    ``reference`` is ``'first'`` or ``'min'`` (per profile), an ``int`` index (per
+    profile), a ``(label, index)`` pair (one global reference point), a float
+    (global absolute energy in ``units``) or ``None`` for no referencing.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if reference is None:
+        ref = 0.0
+    elif isinstance(reference, str) and reference == 'first':
+        first = np.argmax(~np.isnan(matrix), axis=1)
+        ref = matrix[np.arange(len(matrix)), first][:, None]
+    elif isinstance(reference, str) and reference == 'min':
+        ref = np.nanmin(matrix, axis=1, keepdims=True)
+    elif isinstance(reference, (int, np.integer)) and not isinstance(reference, bool):
+        ref = matrix[:, reference][:, None]
+    elif isinstance(reference, (tuple, list)) and len(reference) == 2:
+        label, index = reference
+        if label not in labels:
+            raise ValueError(f"Reference profile '{label}' not found.")
+        ref = matrix[list(labels).index(label), int(index)]
+    elif isinstance(reference, float):
+        ref = reference
+    else:
+        raise ValueError(f"Invalid reference {reference!r}; use 'first', 'min', an index, (label, index), a float or None.")
+
+    if np.any(np.isnan(ref)):
+        raise ValueError("Reference point is missing (NaN) for at least one profile.")
+    return (matrix - ref) * conversion_factor(units, to_units)
+
+
+def load_energies(source, units='hartree', to_units='kcal', reference='first', labels=None, mmap=True):
+    """Read absolute energies, convert units and reference them, ready for ``plot()``.
+
+    See :func:`read_energy_matrix` for the accepted sources and :func:`relative_energies`
+    for ``reference``. Returns ``{label: [relative energies]}`` with ``None`` for gaps.
+    """
+    labels, matrix = read_energy_matrix(source, labels=labels, mmap=mmap)
+    relative = relative_energies(matrix, labels, units=units, to_units=to_units, reference=reference)
+
+    energies = {}
+    for label, row in zip(labels, relative):
+        valid = np.nonzero(~np.isnan(row))[0]
+        end = valid[-1] + 1 if len(valid) else 0  # drop the trailing padding
+        energies[label] = [None if np.isnan(e) else e for e in row[:end].tolist()]
+    return energies
+
+
+def parse_reference(text):
+    """Parse a CLI ``--reference`` value: ``first``, ``min``, ``none``, ``INDEX`` or ``LABEL:INDEX``."""
+    if text is None or text.lower() == 'none':
+        return None
+    if text in ('first', 'min'):
+        return text
+    label, sep, index = text.rpartition(':')
+    if sep:
+        return (label, int(index))
+    return int(text)
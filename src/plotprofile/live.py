@@ -0,0 +1,292 @@
+import logging
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from .plot import desaturate_colours, generate_coordinates
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class LiveProfile:
+    """A profile figure that fills in as energies arrive, e.g. from running calculations.
+
+    The figure is drawn once with :meth:`ReactionProfilePlotter.draw`. Each
+    :meth:`update` or :meth:`extend` only touches the changed series: the curve
+    segments next to the changed points are re-sampled (unchanged segments are
+    reused), markers and labels are moved with ``set_data``/``set_segments`` and
+    label placement is redone only around the changed positions. The y-limits only
+    grow. Redraws are throttled to one per ``min_interval`` seconds; call
+    :meth:`flush` to force a pending one.
+    """
+
+    def __init__(self, plotter, energy_data=None, min_interval=0.25, **draw_kwargs):
+        self.plotter = plotter
+        self.min_interval = float(min_interval)
+        self.data = {
+            label: [None if e is None or np.isnan(e) else e for e in values]
+            for label, values in (plotter._process_energy_data(energy_data).items() if energy_data else [])
+        }
+
+        if self.data:
+            self.fig, self.ax = plotter.draw(self.data, **draw_kwargs)
+            all_energies = plotter._all_energies
+            self._buffer = plotter.buffer_factor * (max(all_energies) - min(all_energies))
+        else:
+            self.fig, self.ax = plt.subplots(figsize=plotter.figsize)
+            plotter._style_axes(self.ax)
+            plotter._artists = {'curves': {}, 'points': {}, 'labels': [], 'point_labels': []}
+            plotter._drawn_colors = {}
+            self._buffer = 0.0
+
+        artists = plotter._artists
+        self._curves = dict(artists['curves'])
+        self._initial_points = {k: list(v) for k, v in artists['points'].items()}
+        self._markers = {}
+        self._labels = {(series, ann.xy[0]): ann for series, ann in artists['labels']}
+        self._point_labels = {(series, ann.xy[0]): ann for series, ann in artists['point_labels']}
+        self._colors = dict(plotter._drawn_colors)
+        self._base_colors = {
+            label: points[0].get_markeredgecolor()
+            for label, points in self._initial_points.items() if points and plotter.point_type != 'bar'
+        }
+        self._segments = {label: {} for label in self.data}
+        self._coords = {label: self._coordinates(label) for label in self.data}
+
+        self._last_draw = 0.0
+        self._pending = False
+
+    # --- public API
+
+    def update(self, label, index, energy):
+        """Set point ``index`` of series ``label`` (``None`` removes it); new series are added."""
+        series = self._series(label)
+        if index >= len(series):
+            series.extend([None] * (index + 1 - len(series)))
+        series[index] = None if energy is None or np.isnan(energy) else float(energy)
+        self._refresh(label, index, index)
+
+    def extend(self, label, energies):
+        """Append ``energies`` to series ``label`` (created if new)."""
+        series = self._series(label)
+        start = len(series)
+        series.extend(None if e is None or np.isnan(e) else float(e) for e in energies)
+        if len(series) > start:
+            self._refresh(label, start, len(series) - 1)
+
+    def flush(self):
+        """Redraw now if an update is waiting for the throttle."""
+        if self._pending:
+            self.fig.canvas.draw_idle()
+            self._last_draw = time.monotonic()
+            self._pending = False
+
+    def save(self, filename, file_format='png', dpi=600):
+        self.flush()
+        self.plotter.save(self.fig, f"{filename}.{file_format}", file_format=file_format, dpi=dpi)
+
+    def close(self):
+        plt.close(self.fig)
+
+    # --- internals
+
+    def _series(self, label):
+        if label not in self.data:
+            self.data[label] = []
+            self._segments[label] = {}
+            self._coords[label] = {}
+        return self.data[label]
+
+    def _coordinates(self, label):
+        return dict(zip(*generate_coordinates(self.data[label])))
+
+    def _color(self, label):
+        """Marker colour and curve colour of ``label``, picking the next palette colour for new series."""
+        if label not in self._colors:
+            p = self.plotter
+            if p.stable_colors:
+                color = p.assign_colors([label])[0]
+            else:
+                color = p._resolve_colors(p.colors, len(self._colors) + 1)[len(self._colors)]
+            self._base_colors[label] = color
+            self._colors[label] = desaturate_colours([color], p.desaturate_factor)[0] if p.desaturate else color
+        return self._base_colors.get(label, self._colors[label]), self._colors[label]
+
+    def _curve(self, label, points):
+        """Curve samples through ``points``, re-using cached segments whose end points did not change."""
+        p = self.plotter
+        if p.level_of_detail or (p.point_type == 'bar' and p.connect_bar_ends):
+            # Handles depend on neighbouring points here, so re-sample the whole series
+            return p._curve_points(points)
+        cache = self._segments[label]
+        fresh = {}
+        pieces = []
+        for pair in zip(points[:-1], points[1:]):
+            piece = cache.get(pair)
+            if piece is None:
+                piece = p._curve_points(list(pair))
+            fresh[pair] = piece
+            pieces.append(piece)
+        self._segments[label] = fresh
+        return np.vstack(pieces)
+
+    def _draw_curve(self, label, points):
+        curve = self._curves.get(label)
+        if len(points) < 2:
+            if curve is not None:
+                curve.set_data([], [])
+            return
+        samples = self._curve(label, points)
+        if curve is None:
+            p = self.plotter
+            _, light = self._color(label)
+            dashed = label in p.dashed
+            curve, = self.ax.plot(
+                samples[:, 0], samples[:, 1], color=light, linewidth=p.line_width,
+                dashes=(p.line_width, p.dash_spacing) if dashed else (p.line_width, 0),
+                dash_capstyle='round',
+            )
+            self._curves[label] = curve
+            if p.show_legend and not label.startswith('_'):
+                self.ax.add_line(Line2D([0], [0], color=light, linewidth=p.line_width,
+                                        linestyle='dashed' if dashed else 'solid', label=label, dash_capstyle='round'))
+                self._legend()
+        else:
+            curve.set_data(samples[:, 0], samples[:, 1])
+
+    def _draw_markers(self, label, points):
+        p = self.plotter
+        markers = self._markers.get(label)
+        if markers is None:
+            # Swap the per-point markers of the initial draw for one artist per series
+            for artist in self._initial_points.pop(label, []):
+                artist.remove()
+            color, _ = self._color(label)
+            if p.point_type == 'bar':
+                markers = LineCollection([], colors='black', linewidths=p.bar_width, zorder=2.01)  # above the curves, as in draw()
+                self.ax.add_collection(markers)
+            elif p.point_type in ['dot', '.']:
+                markers, = self.ax.plot([], [], 'o', linestyle='none', markersize=p.marker_size, color=color)
+            else:
+                markers, = self.ax.plot([], [], marker='o', linestyle='none', markerfacecolor='white',
+                                        markeredgecolor=color, markeredgewidth=p.line_width)
+            self._markers[label] = markers
+        if isinstance(markers, LineCollection):
+            half = p.bar_length / 2
+            markers.set_segments([[(x - half, y), (x + half, y)] for x, y in points])
+        else:
+            markers.set_data([x for x, _ in points], [y for _, y in points])
+
+    def _place_labels(self, xs):
+        """Re-place the energy labels of every series at the positions ``xs``."""
+        p = self.plotter
+        all_xs = sorted(set().union(*self._coords.values()))
+        position = {x: i for i, x in enumerate(all_xs)}
+        peak = {}
+
+        def group_max(x):
+            if x not in peak:
+                peak[x] = max(c[x] for c in self._coords.values() if x in c)
+            return peak[x]
+
+        def is_local_max(x):
+            i = position[x]
+            return 0 < i < len(all_xs) - 1 and group_max(x) > group_max(all_xs[i - 1]) and group_max(x) > group_max(all_xs[i + 1])
+
+        for key in [k for k in self._labels if k[1] in xs and k[1] not in self._coords.get(k[0], {})]:
+            self._labels.pop(key).remove()
+            if key in self._point_labels:
+                self._point_labels.pop(key).remove()
+
+        ys = []
+        for x in sorted(xs):
+            # As in draw(), equal energies of several series at one position share a label
+            shown = {}
+            for label, coords in self._coords.items():
+                if x not in coords:
+                    continue
+                energy = coords[x]
+                above = is_local_max(x)
+                y = energy + self._buffer if above else energy - self._buffer
+                text = f"{energy:.{p.sig_figs}f}".replace('-', '−')
+                ann = self._labels.get((label, x))
+                if text in shown:
+                    if ann is not None:
+                        self._labels.pop((label, x)).remove()
+                    continue
+                if ann is None:
+                    ann = self.ax.annotate(text, xy=(x, y), xytext=(0, 0), textcoords='offset points', ha='center',
+                                           va='center', fontproperties=p.font_properties, fontweight='normal')
+                    self._labels[(label, x)] = ann
+                else:
+                    ann.set_text(text)
+                    ann.xy = (x, y)
+                shown[text] = ann
+                point_label = self._point_labels.get((label, x))
+                if point_label is not None:
+                    point_label.xy = (x, y + self._buffer if above else y - self._buffer)
+                ys.append(y)
+        if ys:
+            self._fit(*ys)
+
+    def _fit(self, *ys):
+        """Grow the y-limits to include ``ys`` with the same padding as :meth:`draw`."""
+        padding = 2 * self._buffer
+        lo, hi = self.ax.get_ylim()
+        new_lo, new_hi = min(lo, min(ys) - padding), max(hi, max(ys) + padding)
+        if (new_lo, new_hi) != (lo, hi):
+            self.ax.set_ylim(new_lo, new_hi)
+
+    def _legend(self):
+        handles, labels = [], []
+        for handle, label in zip(*self.ax.get_legend_handles_labels()):
+            if label and not label.startswith('_unlabeled_'):
+                handles.append(handle)
+                labels.append(label)
+        if handles:
+            order = sorted(range(len(labels)), key=lambda i: list(self.data).index(labels[i]) if labels[i] in self.data else i)
+            self.ax.legend([handles[i] for i in order], [labels[i] for i in order], loc='best', prop=self.plotter.font_properties)
+
+    def _refresh(self, label, first, last):
+        old = self._coords[label]
+        coords = self._coordinates(label)
+        self._coords[label] = coords
+        if self._buffer == 0.0:
+            energies = [y for c in self._coords.values() for y in c.values()]
+            if energies:
+                self._buffer = self.plotter.buffer_factor * (max(energies) - min(energies))
+
+        points = sorted(coords.items())
+        self._draw_curve(label, points)
+        self._draw_markers(label, points)
+
+        # Positions whose value, or whose neighbour's value, changed (duplicate runs shift midpoints)
+        changed = {x for x in set(old) | set(coords) if old.get(x) != coords.get(x)}
+        changed |= {x for x in coords if first - 1 <= x <= last + 1}
+        if changed:
+            xs = sorted(set().union(*self._coords.values()))
+            near = set()
+            for x in changed:
+                i = xs.index(x) if x in xs else None
+                if i is not None:
+                    near.update(xs[max(i - 1, 0):i + 2])
+                else:
+                    near.add(x)
+            if self.plotter.labels:
+                self._place_labels(near)
+            values = [coords[x] for x in changed if x in coords]
+            if values:
+                self._fit(*values)
+            lo, hi = self.ax.get_xlim()
+            self.ax.set_xlim(min(lo, min(changed) - 0.5), max(hi, max(changed) + 0.5))
+
+        self._request_draw()
+
+    def _request_draw(self):
+        self._pending = True
+        if time.monotonic() - self._last_draw >= self.min_interval:
+            self.flush()
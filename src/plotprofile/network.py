@@ -0,0 +1,64 @@
+def _validate_network(network):
+    if not isinstance(network, dict) or 'states' not in network or 'pathways' not in network:
+        raise TypeError('Network input must be a dict with "states" ({state: energy}) and "pathways" ({label: [states]}).')
+    states, pathways = network['states'], network['pathways']
+    if not isinstance(states, dict) or not isinstance(pathways, dict):
+        raise TypeError('"states" and "pathways" must both be dicts.')
+    for label, path in pathways.items():
+        missing = [s for s in path if s is not None and s not in states]
+        if missing:
+            raise ValueError(f"Pathway '{label}' refers to unknown states: {missing}")
+    return states, pathways
+
+
+def pathway_energies(network):
+    """Expand a network into ``{pathway: [energies]}``, the layout ``plot()`` accepts."""
+    states, pathways = _validate_network(network)
+    return {
+        label: [None if s is None else states[s] for s in path]
+        for label, path in pathways.items()
+    }
+
+
+def split_network(network):
+    """Split the pathways of a network into the segments that actually need drawing.
+
+    ``network`` is ``{"states": {state: energy}, "pathways": {label: [states]}}``;
+    a state's position in a pathway is its place on the reaction coordinate and
+    ``None`` leaves a gap. Pathways with a common prefix (the same states at the
+    same positions) share that stretch, so every prefix is drawn once.
+
+    Returns a list of ``(key, parent, pathways, energies, states)`` chains in drawing
+    order. ``key`` is the state sequence up to the end of the chain and ``parent`` the
+    key of the chain it branches off (``None`` for a root); ``pathways`` are the labels
+    using the chain, ``energies`` is ``None``-padded to the chain's positions and
+    ``states`` names its points. A chain starts on the last point of its parent so
+    the curves join up.
+    """
+    states, pathways = _validate_network(network)
+
+    # Pathways sharing each prefix; a prefix is the (position, state) sequence up to a point
+    users = {}
+    for label, path in pathways.items():
+        for i in range(len(path)):
+            users.setdefault(tuple(path[:i + 1]), []).append(label)
+
+    chains = {}
+    for label, path in pathways.items():
+        start, parent = 0, None
+        for i in range(1, len(path) + 1):
+            if i < len(path) and users[tuple(path[:i + 1])] == users[tuple(path[:start + 1])]:
+                continue
+            key = tuple(path[:i])
+            if key not in chains:
+                first = max(start - 1, 0)  # join onto the end of the parent chain
+                padding = [None] * first
+                chains[key] = (
+                    parent,
+                    users[tuple(path[:start + 1])],
+                    padding + [None if s is None else states[s] for s in path[first:i]],
+                    padding + list(path[first:i]),
+                )
+            start, parent = i, key
+
+    return [(key, *chain) for key, chain in chains.items()]
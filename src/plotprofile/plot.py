@@ -2,6 +2,8 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mpc
 from matplotlib.path import Path 
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 import seaborn as sns
 import numpy as np
 from itertools import cycle
@@ -9,30 +11,164 @@ from matplotlib.patches import Circle
 from matplotlib.transforms import Bbox
 from matplotlib.font_manager import FontProperties, fontManager
 
+from .analysis import energetic_span
+from .ensemble import reduce_ensembles
+from .network import pathway_energies, split_network
+
 import colorsys
+import copy
+import heapq
+import io
+import os
 import json
 import importlib.resources as pkg_resources
+from functools import lru_cache
 
 import logging
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-def _load_style(style_name):
+@lru_cache(maxsize=None)
+def _read_styles():
     with pkg_resources.files('plotprofile').joinpath('styles.json').open('r') as f:
-        styles = json.load(f)
+        return json.load(f)
+
+def _load_style(style_name):
+    styles = _read_styles()
 
-    base = styles.get("default", {})
-    overlay = styles.get(style_name, {})
+    base = copy.deepcopy(styles.get("default", {}))
+    overlay = copy.deepcopy(styles.get(style_name, {}))
     base.update(overlay)
     return base
 
+@lru_cache(maxsize=None)
+def _available_fonts():
+    return frozenset(f.name for f in fontManager.ttflist)
+
 def desaturate_colour(color, factor=1.2):
     rgb = mpc.to_rgb(color)
     hls = colorsys.rgb_to_hls(*rgb)
     hls_new = (hls[0], 1 - (0.4 * factor), 0.3 * factor)
     return colorsys.hls_to_rgb(*hls_new)
 
+def desaturate_colours(colors, factor=1.2):
+    """Vectorised :func:`desaturate_colour` over a sequence of colours; returns an ``(n, 3)`` RGB array."""
+    rgb = mpc.to_rgba_array(colors)[:, :3]
+    if len(rgb) == 0:
+        return rgb
+    # Hue as in colorsys.rgb_to_hls
+    maxc, minc = rgb.max(axis=1), rgb.min(axis=1)
+    span = np.where(maxc == minc, 1.0, maxc - minc)
+    rc, gc, bc = ((maxc[:, None] - rgb) / span[:, None]).T
+    r, g = rgb[:, 0], rgb[:, 1]
+    hue = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = np.where(maxc == minc, 0.0, (hue / 6.0) % 1.0)
+
+    # Fixed lightness and saturation, then back as in colorsys.hls_to_rgb
+    light, sat = 1 - (0.4 * factor), 0.3 * factor
+    m2 = light * (1.0 + sat) if light <= 0.5 else light + sat - (light * sat)
+    m1 = 2.0 * light - m2
+
+    def channel(h):
+        h = h % 1.0
+        return np.select(
+            [h < 1 / 6, h < 0.5, h < 2 / 3],
+            [m1 + (m2 - m1) * h * 6.0, np.full_like(h, m2), m1 + (m2 - m1) * (2 / 3 - h) * 6.0],
+            default=m1,
+        )
+
+    if sat == 0.0:
+        return np.full((len(rgb), 3), light)
+    return np.column_stack([channel(hue + 1 / 3), channel(hue), channel(hue - 1 / 3)])
+
+class _Palette:
+    """Resolved RGBA colours for one ``(setting, n)``, with desaturated variants computed on demand."""
+
+    def __init__(self, rgba):
+        rgba.setflags(write=False)
+        self.rgba = rgba
+        self._light = {}
+
+    def light(self, factor):
+        if factor not in self._light:
+            light = desaturate_colours(self.rgba, factor)
+            light.setflags(write=False)
+            self._light[factor] = light
+        return self._light[factor]
+
+_palette_cache = {}
+_PALETTE_CACHE_SIZE = 256
+
+def _palette_key(setting, num_colors):
+    if isinstance(setting, str):
+        return (setting, num_colors)
+    if isinstance(setting, (list, tuple)):
+        key = (tuple(tuple(c) if isinstance(c, list) else c for c in setting), num_colors)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    if isinstance(setting, mpc.Colormap):
+        # Names are not unique (e.g. every ListedColormap defaults to "unnamed"), so key by
+        # the colours actually sampled
+        samples = np.asarray(setting(np.arange(num_colors) / num_colors), dtype=float)
+        return (('cmap', samples.tobytes()), num_colors)
+    return None
+
+
+# Metadata that would otherwise embed the creation date or the matplotlib version
+REPRODUCIBLE_METADATA = {
+    'png': {'Software': None},
+    'svg': {'Date': None, 'Creator': None},
+    'pdf': {'CreationDate': None, 'ModDate': None, 'Creator': None, 'Producer': None},
+    'eps': {'CreationDate': None, 'Creator': None},
+    'ps': {'CreationDate': None, 'Creator': None},
+}
+
+def save_figure(fig, target, file_format='png', dpi=600, reproducible=False, skip_unchanged=False):
+    """Save ``fig`` to ``target`` (a path or a file object); returns ``False`` if the write was skipped.
+
+    ``reproducible=True`` makes the bytes depend only on the figure: SVG ids use a
+    fixed hash salt and creation dates and software versions are left out of the
+    metadata (the PS/EPS date is pinned to the epoch). ``skip_unchanged=True``
+    leaves ``target`` untouched when the file on disk already holds exactly these
+    bytes; it implies ``reproducible``, as otherwise the embedded dates and SVG ids
+    would differ on every save.
+    """
+    reproducible = reproducible or skip_unchanged
+    kwargs = dict(format=file_format, dpi=dpi, bbox_inches='tight')
+    if reproducible:
+        kwargs['metadata'] = REPRODUCIBLE_METADATA.get(file_format, {})
+    else:
+        fig.savefig(target, **kwargs)
+        return True
+
+    buf = io.BytesIO()
+    # The PS backend ignores a CreationDate of None but honours SOURCE_DATE_EPOCH
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    os.environ['SOURCE_DATE_EPOCH'] = epoch or '0'
+    try:
+        with plt.rc_context({'svg.hashsalt': 'plotprofile', 'svg.id': 'plotprofile'}):
+            fig.savefig(buf, **kwargs)
+    finally:
+        if epoch is None:
+            del os.environ['SOURCE_DATE_EPOCH']
+    data = buf.getvalue()
+
+    if hasattr(target, 'write'):
+        target.write(data)
+        return True
+    if skip_unchanged and os.path.exists(target) and os.path.getsize(target) == len(data):
+        with open(target, 'rb') as f:
+            if f.read() == data:
+                logger.info(f"{target} is unchanged; not rewriting it.")
+                return False
+    with open(target, 'wb') as f:
+        f.write(data)
+    return True
+
 
 def generate_coordinates(energies):
     x_coords, y_coords = [], []
@@ -63,6 +199,136 @@ def generate_coordinates(energies):
         i = j
     return x_coords, y_coords
 
+def stationary_indices(y, threshold=0.0):
+    """Indices of the end points and the local minima/maxima of ``y`` (plateaus count once).
+
+    With ``threshold`` > 0 only extrema the curve swings away from by more than
+    ``threshold`` are kept, so noise smaller than that does not count.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n < 3:
+        return np.arange(n)
+    d = np.sign(np.diff(y))
+    # carry the last non-zero slope sign across flat stretches
+    idx = np.maximum.accumulate(np.where(d != 0, np.arange(len(d)), 0))
+    d = d[idx]
+    turning = np.nonzero(d[:-1] * d[1:] < 0)[0] + 1
+    if threshold <= 0 or len(turning) == 0:
+        return np.unique(np.concatenate(([0], turning, [n - 1])))
+
+    # Zigzag filter: follow the running extreme and keep it once the curve turns back by more than threshold
+    kept, pending, direction = [0], None, 0
+    for i in turning.tolist() + [n - 1]:
+        if direction == 0:
+            if abs(y[i] - y[0]) > threshold:
+                pending, direction = i, 1 if y[i] > y[0] else -1
+        elif (y[i] - y[pending]) * direction > 0:
+            pending = i
+        elif (y[pending] - y[i]) * direction > threshold:
+            kept.append(pending)
+            pending, direction = i, -direction
+    kept.append(n - 1)
+    return np.unique(kept)
+
+def simplify_curve(x, y, tolerance, keep=()):
+    """Ramer-Douglas-Peucker simplification; returns the sorted indices of the kept points.
+
+    Points listed in ``keep`` are always retained and split the curve into
+    stretches that are simplified independently.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    anchors = np.unique(np.concatenate(([0, n - 1], np.asarray(keep, dtype=int))))
+    kept = np.zeros(n, dtype=bool)
+    kept[anchors] = True
+
+    stack = [(a, b) for a, b in zip(anchors[:-1], anchors[1:]) if b - a > 1]
+    while stack:
+        a, b = stack.pop()
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        seg = np.hypot(dx, dy)
+        px, py = x[a + 1:b] - x[a], y[a + 1:b] - y[a]
+        if seg == 0:
+            dist = np.hypot(px, py)
+        else:
+            dist = np.abs(dx * py - dy * px) / seg
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            m = a + 1 + k
+            kept[m] = True
+            if m - a > 1:
+                stack.append((a, m))
+            if b - m > 1:
+                stack.append((m, b))
+    return np.nonzero(kept)[0]
+
+def pixel_extremes(x, y):
+    """Indices of the first, last, lowest and highest point in each unit-wide column of ``x``.
+
+    ``x`` is in pixels and sorted. Drawing only these points gives the same raster as
+    drawing all of them, and there are at most four per pixel column.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    column = np.floor(x - x[0]).astype(np.int64)
+    starts = np.concatenate(([0], np.nonzero(np.diff(column))[0] + 1))
+    ends = np.concatenate((starts[1:] - 1, [len(x) - 1]))
+    order = np.lexsort((y, column))  # by column, then by y within each column
+    return np.unique(np.concatenate((starts, ends, order[starts], order[ends])))
+
+def _most_prominent(y, idx, budget):
+    """Pick at most ``budget`` of the stationary points ``idx``, keeping the end points and the largest swings."""
+    if len(idx) <= budget:
+        return idx
+    ys = y[idx]
+    swing = np.minimum(np.abs(ys - np.roll(ys, 1)), np.abs(ys - np.roll(ys, -1)))
+    swing[[0, -1]] = np.inf
+    chosen = np.argsort(-swing, kind='stable')[:budget]
+    return idx[np.sort(chosen)]
+
+def _tangent_slopes(points):
+    """Central-difference slopes for curve handles, zero at the ends and at turning points."""
+    pts = np.asarray(points, dtype=float)
+    slopes = np.zeros(len(pts))
+    if len(pts) < 3:
+        return slopes
+    dx = pts[2:, 0] - pts[:-2, 0]
+    dy = pts[2:, 1] - pts[:-2, 1]
+    back = pts[1:-1, 1] - pts[:-2, 1]
+    fwd = pts[2:, 1] - pts[1:-1, 1]
+    monotone = (back * fwd > 0) & (dx != 0)
+    slopes[1:-1] = np.where(monotone, dy / np.where(dx == 0, 1, dx), 0.0)
+    return slopes
+
+def pack_intervals(intervals):
+    """Assign ``(start, end)`` intervals to the fewest rows so that intervals in a row do not overlap.
+
+    Greedy interval partitioning: intervals are taken by start (longest first on
+    ties, so enclosing steps sit nearest the data) and go to the row that frees up
+    first. Touching intervals go to separate rows, so arrow heads meeting at a shared
+    point do not run into each other. Returns one row index per interval.
+    """
+    spans = [(min(a, b), max(a, b)) for a, b in intervals]
+    order = sorted(range(len(spans)), key=lambda i: (spans[i][0], -spans[i][1]))
+    rows = [0] * len(spans)
+    free = []  # (end of last interval, row)
+    n_rows = 0
+    for i in order:
+        start, end = spans[i]
+        if free and free[0][0] < start:
+            _, row = heapq.heappop(free)
+        else:
+            row, n_rows = n_rows, n_rows + 1
+        rows[i] = row
+        heapq.heappush(free, (end, row))
+    return rows
+
+# Open chevron arrow heads pointing right/left, tip on the data point
+_HEAD_RIGHT = Path([(-2, 1), (0, 0), (-2, -1)], [Path.MOVETO, Path.LINETO, Path.LINETO])
+_HEAD_LEFT = Path([(2, 1), (0, 0), (2, -1)], [Path.MOVETO, Path.LINETO, Path.LINETO])
+
 def cubic_bezier_points(P0, P1, P2, P3, num=500):
     t = np.linspace(0, 1, num)
     points = ((1 - t)**3)[:, None] * P0 + \
@@ -119,10 +385,19 @@ class ReactionProfilePlotter:
             self.x_label = style_dict.get('x_label', None)
             self.y_label = style_dict.get('y_label', None)
             self.x_indices = bool(style_dict.get('x_indices', False))
+            self.level_of_detail = bool(style_dict.get('level_of_detail', False))
+            self.stable_colors = bool(style_dict.get('stable_colors', False))
+            self.stable_palette_size = int(style_dict.get('stable_palette_size', 10))
+            self.band_alpha = float(style_dict.get('band_alpha', 0.25))
+            self.shared_color = style_dict.get('shared_color', '#7f7f7f')
+            self.reproducible = bool(style_dict.get('reproducible', False))
+            self.skip_unchanged = bool(style_dict.get('skip_unchanged', False))
         except Exception as e:
             logger.error(f"Invalid style parameters: {e}")
             raise ValueError(f"Invalid style parameters: {e}")
 
+        self._label_colors = {}
+
         self.font_kwargs = {
             'fontsize': style_dict.get('font_size', 10),
         }
@@ -135,12 +410,27 @@ class ReactionProfilePlotter:
             'fontweight': style_dict.get('annotation_weight', 'semibold'),
             'fontstyle': style_dict.get('annotation_style', 'italic'),
         }
+
+    def template(self):
+        """Return a :class:`ProfileTemplate` for rendering many profiles in this style."""
+        return ProfileTemplate(self)
+
+    def save(self, fig, target, file_format='png', dpi=600):
+        """Save a figure from this plotter, honouring the ``reproducible`` and ``skip_unchanged`` style keys."""
+        return save_figure(fig, target, file_format=file_format, dpi=dpi,
+                           reproducible=self.reproducible, skip_unchanged=self.skip_unchanged)
+
+    def live(self, energy_data=None, min_interval=0.25, **kwargs):
+        """Return a :class:`~plotprofile.live.LiveProfile` that updates in place as energies arrive."""
+        from .live import LiveProfile
+
+        return LiveProfile(self, energy_data, min_interval=min_interval, **kwargs)
+
     def _get_font_properties(self, font_dict):
         requested_family = font_dict.get('font_family', 'sans-serif')
         
         # Check if requested font is available
-        available_fonts = {f.name for f in fontManager.ttflist}
-        if requested_family not in available_fonts:
+        if requested_family not in _available_fonts():
             logger.info(f"Font '{requested_family}' not found. Using fallback 'DejaVu Sans'.")
             requested_family = 'DejaVu Sans'
 
@@ -151,7 +441,27 @@ class ReactionProfilePlotter:
             size=font_dict.get('font_size', 10),
         )
 
+    def _palette(self, setting, num_colors):
+        """Return the cached :class:`_Palette` for ``(setting, num_colors)``."""
+        key = _palette_key(setting, num_colors)
+        palette = _palette_cache.get(key) if key is not None else None
+        if palette is None:
+            try:
+                rgba = mpc.to_rgba_array(self._resolve_colors_uncached(setting, num_colors))
+            except ValueError as e:
+                logger.error(f"Invalid colour in {setting}: {e}. Defaulting to 'viridis' cmap.")
+                rgba = mpc.to_rgba_array(self._resolve_colors_uncached('viridis', num_colors))
+            palette = _Palette(rgba)
+            if key is not None:
+                if len(_palette_cache) >= _PALETTE_CACHE_SIZE:
+                    _palette_cache.clear()
+                _palette_cache[key] = palette
+        return palette
+
     def _resolve_colors(self, setting, num_colors):
+        return list(self._palette(setting, num_colors).rgba)
+
+    def _resolve_colors_uncached(self, setting, num_colors):
         try:
             if isinstance(setting, str):
                 try:
@@ -170,11 +480,141 @@ class ReactionProfilePlotter:
                 return [setting(i / num_colors) for i in range(num_colors)]
             else:
                 logger.error(f"Invalid colour {setting}; `colors` must be a palette name (str), colormap object, or list of color codes. Defaulting to 'viridis' cmap.")
+                fallback = plt.get_cmap('viridis')
+                return [fallback(i / num_colors) for i in range(num_colors)]
         except Exception as e:
             logger.error(f"Error resolving colors: Check for typos. Defaulting to 'viridis' cmap.")
             fallback = plt.get_cmap('viridis')
             return [fallback(i / num_colors) for i in range(num_colors)]
         
+    def assign_colors(self, labels):
+        """Return a colour per label, keeping the colour each label was first given by this plotter.
+
+        New labels take the next colour of the palette (the ``colors`` list, or
+        ``stable_palette_size`` samples of a named palette/colormap), cycling if needed.
+        """
+        size = len(self.colors) if isinstance(self.colors, list) else self.stable_palette_size
+        palette = self._palette(self.colors, size).rgba
+        for label in labels:
+            if label not in self._label_colors:
+                self._label_colors[label] = palette[len(self._label_colors) % len(palette)]
+        return [self._label_colors[label] for label in labels]
+
+    def _clean_annotations(self, annotations):
+        if annotations is None:
+            return None
+        if not isinstance(annotations, dict):
+            logger.warning("Annotations should be a dictionary of label: (start, end). Skipping annotations.")
+            return None
+        clean_annotations = {}
+        for label, val in annotations.items():
+            if (isinstance(val, (tuple, list)) and len(val) == 2 and all(isinstance(v, (int, float)) for v in val)):
+                clean_annotations[label] = tuple(val)
+            else:
+                logger.warning(f"Invalid annotation '{label}': {val}. Skipping.")
+        return clean_annotations
+
+    def _draw_annotations(self, ax, all_energies):
+        """Draw the segment annotations below the data; returns the artists.
+
+        Overlapping or touching segments are stacked in rows (see :func:`pack_intervals`). All
+        arrow shafts are one collection and the heads two marker lines; the bottom
+        margin for the rows is computed up front so the y-limits are set once.
+        """
+        artists = []
+        if not self.annotations:
+            return artists
+
+        energy_range = max(all_energies) - min(all_energies)
+        y_min, y_max = ax.get_ylim()
+        y_arrow = y_min - self.annotation_buffer * energy_range  # place below data
+
+        labels = list(self.annotations)
+        spans = [self.annotations[label] for label in labels]
+        rows = pack_intervals(spans)
+        n_rows = max(rows) + 1
+        n_lines = max(label.count("\n") + 1 for label in labels)
+
+        y_buffer = self.annotation_space * energy_range
+        if self.axes in ['x', 'both', 'box']:
+            if n_lines > 1:
+                y_buffer = y_buffer * 1.75  # sort spacing automatically for labels with multiple lines
+            if self.annotation_below_arrow:
+                y_buffer = y_buffer * 2
+
+        # Row pitch in inches: the label height, plus the arrow when the label hangs below it.
+        # Extra lines beyond the first also need room under the last row. Converting inches
+        # to data units depends on the final limits, so solve for the bottom limit:
+        # bottom = y_arrow - y_buffer - ((n_rows - 1) * pitch + extra) * (y_max - bottom) / axes_height
+        font_size = self.annotation_kwargs['fontsize']
+        font_size = font_size if isinstance(font_size, (int, float)) else self.font_size
+        pitch = (n_lines * 1.2 * font_size + (2 + 2 * self.arrow_width if self.annotation_below_arrow else 2)) / 72
+        extra = (n_lines - 1) * (1.2 if self.annotation_below_arrow else 0.6) * font_size / 72
+        axes_height = ax.get_position().height * ax.figure.get_size_inches()[1]
+        k = min(((n_rows - 1) * pitch + extra) / axes_height, 0.9)
+        bottom = (y_arrow - y_buffer - k * y_max) / (1 - k)
+        row_step = pitch * (y_max - bottom) / axes_height
+        ax.set_ylim(bottom, y_max)
+
+        segments, x_left, x_right, y_heads = [], [], [], []
+        for label, (x_start, x_end), row in zip(labels, spans, rows):
+            y = y_arrow - row * row_step
+            segments.append([(x_start, y), (x_end, y)])
+            x_left.append(min(x_start, x_end))
+            x_right.append(max(x_start, x_end))
+            y_heads.append(y)
+
+            x_center = (x_start + x_end) / 2
+            if not self.annotation_below_arrow:
+                bbox_props = dict(
+                    boxstyle='round,pad=0.2',
+                    facecolor='white',
+                    edgecolor='none',
+                )
+                artists.append(ax.annotate(
+                    label,
+                    xy=(x_center, y),
+                    xytext=(0, 0),
+                    textcoords='offset points',
+                    ha='center',
+                    va='center',
+                    color=self.annotation_color,
+                    bbox=bbox_props,
+                    annotation_clip=False,
+                    zorder=3.1,
+                    **self.annotation_kwargs,
+                ))
+            else:
+                artists.append(ax.annotate(
+                    label,
+                    xy=(x_center, y),
+                    xytext=(0, -2 - self.arrow_width),
+                    textcoords='offset points',
+                    ha='center',
+                    va='top',
+                    color=self.annotation_color,
+                    annotation_clip=False,
+                    **self.annotation_kwargs,
+                ))
+
+        shafts = LineCollection(segments, colors=self.arrow_color, linewidths=self.arrow_width, clip_on=False, zorder=3)
+        ax.add_collection(shafts, autolim=False)
+        head_style = dict(
+            linestyle='none', color=self.arrow_color, markerfacecolor='none',
+            markeredgewidth=self.arrow_width, markersize=3 + 2 * self.arrow_width, clip_on=False, zorder=3,
+        )
+        right, = ax.plot(x_right, y_heads, marker=_HEAD_RIGHT, scalex=False, scaley=False, **head_style)
+        left, = ax.plot(x_left, y_heads, marker=_HEAD_LEFT, scalex=False, scaley=False, **head_style)
+        return [shafts, right, left] + artists
+
+    def update_annotations(self, ax, annotations):
+        """Replace the segment annotations on an axes built by :meth:`draw`, leaving curves and labels untouched."""
+        for artist in self._annotation_artists:
+            artist.remove()
+        self.annotations = self._clean_annotations(annotations)
+        ax.set_ylim(*self._base_ylim)
+        self._annotation_artists = self._draw_annotations(ax, self._all_energies)
+
     def _validate_energy_list(self, lst, label=None):
         if not isinstance(lst, list):
             raise TypeError(f"Energy profile '{label}' must be a list." if label else "Energy profile must be a list.")
@@ -196,8 +636,107 @@ class ReactionProfilePlotter:
                 raise TypeError(f"Invalid energy value at index {i}{label_str}: {val} (type {type(val)})")
         return valid_list
 
-    def plot(self, energy_data, filename=None, annotations=None, point_labels=None, file_format='png', dpi=600, include_keys=None, exclude_from_legend=[]):
+    def _apply_level_of_detail(self, coords):
+        """Simplify long series for drawing; returns ``(curve_coords, marker_coords, label_coords)``.
+
+        Stationary points the curve swings away from by more than half a pixel are
+        always kept. The stretches between them are simplified to within half a
+        pixel, and markers and labels are capped at a budget set by the figure's
+        pixel width, keeping the most prominent stationary points.
+        """
+        dpi = plt.rcParams['figure.dpi']
+        width_px, height_px = self.figsize[0] * dpi, self.figsize[1] * dpi
+        n_series = max(len(coords), 1)
+        marker_budget = max(2, int(width_px / (2 * self.marker_size * dpi / 72)) // n_series)
+        label_budget = max(2, int(width_px / (3 * self.font_size * dpi / 72)) // n_series)
+
+        all_x = np.array([xv for xs, ys in coords for xv, yv in zip(xs, ys) if not np.isnan(yv)])
+        all_y = np.array([yv for xs, ys in coords for yv in ys if not np.isnan(yv)])
+        x_scale = width_px / (np.ptp(all_x) or 1.0)
+        y_scale = height_px / (np.ptp(all_y) or 1.0)
+
+        curve_coords, marker_coords, label_coords = [], [], []
+        for xs, ys in coords:
+            x = np.asarray(xs, dtype=float)
+            y = np.asarray(ys, dtype=float)
+            valid = ~np.isnan(y)
+            x, y = x[valid], y[valid]
+            if len(x) <= marker_budget:
+                for out in (curve_coords, marker_coords, label_coords):
+                    out.append((x.tolist(), y.tolist()))
+                continue
 
+            # Turning points within the half-pixel tolerance are noise; RDP handles them
+            stationary = stationary_indices(y * y_scale, threshold=0.5)
+            markers = _most_prominent(y, stationary, marker_budget)
+            labelled = _most_prominent(y, stationary, label_budget)
+            if len(x) > 4 * width_px:
+                # More points than pixel columns: thin to each column's extremes first, which keeps
+                # every visible peak, and pin only the marked points, so the work stays bounded
+                pinned = np.union1d(markers, labelled)
+                dense = np.union1d(pixel_extremes(x * x_scale, y), pinned)
+                keep = np.searchsorted(dense, pinned)
+                kept = dense[simplify_curve(x[dense] * x_scale, y[dense] * y_scale, 0.5, keep=keep)]
+            else:
+                kept = simplify_curve(x * x_scale, y * y_scale, 0.5, keep=stationary)
+            logger.info(f"Level of detail: drawing {len(kept)}/{len(x)} points, {len(markers)} markers and {len(labelled)} labels.")
+            curve_coords.append((x[kept].tolist(), y[kept].tolist()))
+            marker_coords.append((x[markers].tolist(), y[markers].tolist()))
+            label_coords.append((x[labelled].tolist(), y[labelled].tolist()))
+        return curve_coords, marker_coords, label_coords
+
+    def _curve_points(self, valid_points, bezier_samples=500):
+        """Sample the smooth profile curve through ``valid_points``; returns an ``(n, 2)`` array or ``None``."""
+        verts, codes = [], [Path.MOVETO]
+        bar_adjust = self.point_type == 'bar' and self.connect_bar_ends
+        bar_half_width = self.bar_length / 2
+
+        processed_points = []
+        for j, (x_pt, y_pt) in enumerate(valid_points):
+            if bar_adjust:
+                if j == 0:
+                    processed_points.append((x_pt + bar_half_width, y_pt))
+                elif j == len(valid_points) - 1:
+                    processed_points.append((x_pt - bar_half_width, y_pt))
+                else:
+                    processed_points.append((x_pt - bar_half_width, y_pt))
+                    processed_points.append((x_pt + bar_half_width, y_pt))
+            else:
+                processed_points.append((x_pt, y_pt))
+
+        # Handles are horizontal at stationary points; in level-of-detail mode the
+        # intermediate points kept by the simplification follow the local slope
+        if self.level_of_detail and not bar_adjust:
+            slopes = _tangent_slopes(processed_points)
+        else:
+            slopes = np.zeros(len(processed_points))
+
+        for j in range(0, len(processed_points) - 1):
+            x0, y0 = processed_points[j]
+            x1, y1 = processed_points[j + 1]
+            dx = self.curviness * (x1 - x0)
+
+            if not verts:
+                verts.append([x0, y0])
+            verts.append([x0 + dx, y0 + dx * slopes[j]])
+            verts.append([x1 - dx, y1 - dx * slopes[j + 1]])
+            verts.append([x1, y1])
+            codes += [Path.CURVE4, Path.CURVE4, Path.CURVE4]
+
+        verts = np.array(verts)
+        all_points = []
+        for j in range(0, len(verts) - 3, 3):
+            P0 = verts[j]
+            P1 = verts[j + 1]
+            P2 = verts[j + 2]
+            P3 = verts[j + 3]
+            bezier_points = cubic_bezier_points(P0, P1, P2, P3, num=bezier_samples)
+            all_points.append(bezier_points)
+        if len(all_points) == 0:
+            return None
+        return np.vstack(all_points)
+
+    def _process_energy_data(self, energy_data):
         processed_dict = {}
         if isinstance(energy_data, dict):
             # Dict of named profiles: {label: [values]}
@@ -217,20 +756,51 @@ class ReactionProfilePlotter:
         else:
             logger.error(f"Invalid input type for energy_data: {type(energy_data)}")
             raise TypeError("Data input must be a dict, list of lists, or a single list.")
+        return processed_dict
 
-        if annotations is not None:
-            if not isinstance(annotations, dict):
-                logger.warning("Annotations should be a dictionary of label: (start, end). Skipping annotations.")
-                annotations = None
+    def plot(self, energy_data, filename=None, annotations=None, point_labels=None, file_format='png', dpi=600, include_keys=None, exclude_from_legend=[], mark_span=False):
+        fig, ax = self.draw(energy_data, annotations=annotations, point_labels=point_labels, include_keys=include_keys, exclude_from_legend=exclude_from_legend, mark_span=mark_span)
+
+        if filename:
+            self.save(fig, f"{filename}.{file_format}", file_format=file_format, dpi=dpi)
+
+        return None
+
+    def animate(self, energy_data, filename, frames=100, fps=20, dpi=150, fade=0.5, **kwargs):
+        """Save a step-by-step reveal of the profile as ``.gif``/``.mp4``, or as ``<filename>_NNNN.svg`` frames.
+
+        The figure is drawn once; frames only update curve data and artist
+        visibility (see :class:`~plotprofile.animation.ProfileAnimation`).
+        Extra keyword arguments are passed to :meth:`draw`.
+        """
+        from .animation import ProfileAnimation
+
+        animation = ProfileAnimation(self, energy_data, frames=frames, fade=fade, **kwargs)
+        try:
+            if filename.lower().endswith(('.gif', '.mp4')):
+                animation.save(filename, fps=fps, dpi=dpi)
             else:
-                clean_annotations = {}
-                for label, val in annotations.items():
-                    if (isinstance(val, (tuple, list)) and len(val) == 2 and all(isinstance(v, (int, float)) for v in val)):
-                        clean_annotations[label] = tuple(val)
-                    else:
-                        logger.warning(f"Invalid annotation '{label}': {val}. Skipping.")
-                annotations = clean_annotations
-        self.annotations = annotations
+                animation.save_svg_frames(filename)
+        finally:
+            animation.close()
+
+        return None
+
+    def draw(self, energy_data, annotations=None, point_labels=None, include_keys=None, exclude_from_legend=[], ax=None, style_axes=True, tight_layout=True, series_colors=None, mark_span=False, energy_range=None):
+        """Build the reaction profile figure without saving it; returns ``(fig, ax)``.
+
+        Pass ``ax`` to draw onto an existing axes; ``style_axes=False`` skips the
+        axis labels, spines and ticks when the axes is already styled.
+        ``series_colors`` maps series labels to colours, overriding ``colors``.
+        ``mark_span=True`` marks each series' energetic span between its
+        TOF-determining intermediate and transition state. ``energy_range`` sets
+        the span the label offsets are scaled from, instead of this data's own
+        range (e.g. for panels sharing y-limits).
+        """
+
+        processed_dict = self._process_energy_data(energy_data)
+
+        self.annotations = self._clean_annotations(annotations)
 
         if include_keys is not None:
             processed_dict = {k: v for k, v in processed_dict.items() if k in include_keys}
@@ -281,17 +851,42 @@ class ReactionProfilePlotter:
 
         coords = [generate_coordinates(e) for e in energy_sets]
         all_energies = [e for xs, ys in coords for e in ys if not np.isnan(e)]
-        buffer_space = self.buffer_factor * (max(all_energies) - min(all_energies))
+        marker_coords = label_source = coords
+        bezier_samples = 500
+        if self.level_of_detail:
+            coords, marker_coords, label_source = self._apply_level_of_detail(coords)
+            n_segments = sum(max(len(xs) - 1, 1) for xs, _ in coords)
+            bezier_samples = max(8, min(500, int(2 * self.figsize[0] * plt.rcParams['figure.dpi'] / n_segments)))
+        if energy_range is None:
+            energy_range = max(all_energies) - min(all_energies)
+        buffer_space = self.buffer_factor * energy_range
         buffer_range = 1.0
 
         base_colors = self.colors
-        colors = self._resolve_colors(base_colors, len(energy_sets))
+        if series_colors is not None:
+            colors = [series_colors[k] for k in labels]
+        elif self.stable_colors:
+            colors = self.assign_colors(labels)
+        else:
+            palette = self._palette(base_colors, len(energy_sets))
+            colors = list(palette.rgba)
         colors = colors[::-1]
 
-        light_colors = [desaturate_colour(c, self.desaturate_factor) for c in colors] if self.desaturate else colors
+        if not self.desaturate:
+            light_colors = colors
+        elif series_colors is None and not self.stable_colors:
+            light_colors = list(palette.light(self.desaturate_factor)[::-1])
+        else:
+            light_colors = list(desaturate_colours(colors, self.desaturate_factor))
+        self._drawn_colors = dict(zip(reversed(labels), light_colors))
 
-        fig, ax = plt.subplots(figsize=self.figsize)
+        if ax is None:
+            fig, ax = plt.subplots(figsize=self.figsize)
+        else:
+            fig = ax.figure
         labeled_coords = set()
+        # Data artists per series, for in-place updates (animation, live profiles)
+        self._artists = {'curves': {}, 'points': {}, 'labels': [], 'point_labels': []}
         if self.labels:
             ax.margins(x=0.08, y=0.1)  # Add to avoid label overlap with edge of plot
 
@@ -303,51 +898,13 @@ class ReactionProfilePlotter:
                 logger.info(f"Not enough valid points for curve - just plotting an individual point for series: {labels[i]}")
                 continue
             linestyle = 'dashed' if i in [len(coords) - 1 - d for d in dashed_indices] else 'solid'
-            verts, codes = [], [Path.MOVETO]
-            bar_adjust = self.point_type == 'bar' and self.connect_bar_ends
-            bar_half_width = self.bar_length / 2
-
-            processed_points = []
-            for j, (x_pt, y_pt) in enumerate(valid_points):
-                if bar_adjust:
-                    if j == 0:
-                        processed_points.append((x_pt + bar_half_width, y_pt))
-                    elif j == len(valid_points) - 1:
-                        processed_points.append((x_pt - bar_half_width, y_pt))
-                    else:
-                        processed_points.append((x_pt - bar_half_width, y_pt))
-                        processed_points.append((x_pt + bar_half_width, y_pt))
-                else:
-                    processed_points.append((x_pt, y_pt))
-
-            for j in range(0, len(processed_points) - 1):
-                x0, y0 = processed_points[j]
-                x1, y1 = processed_points[j + 1]
-
-                if not verts:
-                    verts.append([x0, y0])
-                verts.append([x0 + self.curviness * (x1 - x0), y0])
-                verts.append([x1 - self.curviness * (x1 - x0), y1])
-                verts.append([x1, y1])
-                codes += [Path.CURVE4, Path.CURVE4, Path.CURVE4]
-
-            path = Path(verts, codes)
             label = labels[len(coords) - 1 - i]
-            
-            verts = np.array(verts)
-            all_points = []
-            for j in range(0, len(verts) - 3, 3):
-                P0 = verts[j]
-                P1 = verts[j + 1]
-                P2 = verts[j + 2]
-                P3 = verts[j + 3]
-                bezier_points = cubic_bezier_points(P0, P1, P2, P3)
-                all_points.append(bezier_points)
-            if len(all_points) == 0:
+            all_points = self._curve_points(valid_points, bezier_samples)
+            if all_points is None:
                 logger.warning(f"No valid points to draw curve for label '{label}'. Skipping.")
                 continue
-            all_points = np.vstack(all_points)
-            ax.plot(all_points[:, 0], all_points[:, 1], color=light_colors[i], linewidth=self.line_width, dashes=(self.line_width,self.dash_spacing) if linestyle == 'dashed' else (self.line_width,0), linestyle=linestyle, dash_capstyle='round')
+            curve, = ax.plot(all_points[:, 0], all_points[:, 1], color=light_colors[i], linewidth=self.line_width, dashes=(self.line_width,self.dash_spacing) if linestyle == 'dashed' else (self.line_width,0), linestyle=linestyle, dash_capstyle='round')
+            self._artists['curves'][label] = curve
             if label not in exclude_from_legend:
                 legend_line = Line2D(
                     [0], [0],
@@ -361,16 +918,17 @@ class ReactionProfilePlotter:
                 ax.add_line(legend_line)
 
         # --- draw points
-        for i, (x, y) in enumerate(reversed(coords)):
+        for i, (x, y) in enumerate(reversed(marker_coords)):
+            points = self._artists['points'].setdefault(labels[len(coords) - 1 - i], [])
             for j, energy in enumerate(y):
                 if np.isnan(energy):
                     continue
                 if self.point_type == 'bar':
-                    ax.plot([x[j] - self.bar_length/2, x[j] + self.bar_length/2], [energy, energy], color='black', lw=self.bar_width)
+                    points += ax.plot([x[j] - self.bar_length/2, x[j] + self.bar_length/2], [energy, energy], color='black', lw=self.bar_width)
                 elif self.point_type in ['dot', '.']:
-                    ax.plot(x[j], energy, 'o', markersize=self.marker_size, color=colors[i])
+                    points += ax.plot(x[j], energy, 'o', markersize=self.marker_size, color=colors[i])
                 elif self.point_type in ['hollow', 'o']:
-                    ax.plot(x[j], energy, marker='o', markerfacecolor='white', markeredgecolor=colors[i], markeredgewidth=self.line_width)
+                    points += ax.plot(x[j], energy, marker='o', markerfacecolor='white', markeredgecolor=colors[i], markeredgewidth=self.line_width)
 
         # --- draw points and labels
         if self.labels:
@@ -384,7 +942,7 @@ class ReactionProfilePlotter:
             point_label_extents = []
 
             # Sort points for local max detection
-            sorted_points = sorted([(x, y) for coords_ in coords for x, y in zip(*coords_) if not np.isnan(y)], key=lambda p: p[0])
+            sorted_points = sorted([(x, y) for coords_ in label_source for x, y in zip(*coords_) if not np.isnan(y)], key=lambda p: p[0])
             x_group = {}
             for px, py in sorted_points:
                 x_group.setdefault(round(px, 3), []).append(py)
@@ -509,6 +1067,7 @@ class ReactionProfilePlotter:
                 )
 
                 label_extents.append((x, preferred_y))
+                self._artists['labels'].append((labels[parent_idx], energy_label))
 
                 # Add point label if it exists for this coordinate
                 if processed_point_labels is not None:
@@ -522,7 +1081,7 @@ class ReactionProfilePlotter:
                     if point_label:
                         y_label = preferred_y + buffer_space if preferred_above else preferred_y - buffer_space
                         
-                        ax.annotate(
+                        point_label_artist = ax.annotate(
                             point_label,
                             xy=(x, y_label),
                             xytext=(0, 0),
@@ -534,6 +1093,7 @@ class ReactionProfilePlotter:
                             color=self.point_label_color,
                         )
                         point_label_extents.append((x, y_label))
+                        self._artists['point_labels'].append((labels[parent_idx], point_label_artist))
                         
 
             if label_extents or point_label_extents:
@@ -555,75 +1115,274 @@ class ReactionProfilePlotter:
             if handles:
                 ax.legend(handles[::-1], labels_[::-1], loc='best', prop=self.font_properties)
 
+        if mark_span:
+            self._mark_energetic_span(ax, {k: processed_dict[k] for k in labels})
+
         # --- segment annotations with double-headed arrows
-        if self.annotations:
-            y_min, _ = ax.get_ylim()
-            y_arrow = y_min - self.annotation_buffer * (max(all_energies) - min(all_energies))  # place below data
-            increase_label_space = False
-            for label, (x_start, x_end) in self.annotations.items():
-                if "\n" in label:
-                    increase_label_space = True # sort spacing automatically for labels with multiple lines
-                # Draw double-headed arrow
-                ax.annotate(
-                    '', 
-                    xy=(x_end, y_arrow), 
-                    xytext=(x_start, y_arrow),
-                    arrowprops=dict(
-                        arrowstyle='<->',
-                        color=self.arrow_color,
-                        lw=self.arrow_width,
-                        # ls='--',
-                        shrinkA=0.5,
-                        shrinkB=0.5,
-                    ),
-                    annotation_clip=False
-                )
+        self._all_energies = all_energies
+        self._base_ylim = ax.get_ylim()
+        self._annotation_artists = self._draw_annotations(ax, all_energies)
+
+        if style_axes:
+            self._style_axes(ax)
+        if tight_layout:
+            fig.tight_layout()
+
+        return fig, ax
+
+    def draw_grid(self, datasets, ncols=None, titles=None, annotations=None, point_labels=None, sharey=False, include_keys=None, exclude_from_legend=[]):
+        """Draw several energy datasets as panels of one figure; returns ``(fig, axes)``.
+
+        ``datasets`` is a dict of ``{title: energy_data}`` or a list of energy data.
+        ``annotations`` and ``point_labels`` are dicts keyed by panel title (or lists
+        in panel order). Series with the same label share a colour across panels,
+        and ``sharey=True`` gives every panel the same y-limits.
+        """
+        if isinstance(datasets, dict):
+            panel_keys = list(datasets.keys())
+            panel_titles = list(panel_keys)
+            panels = list(datasets.values())
+        elif isinstance(datasets, list):
+            panel_keys = list(range(len(datasets)))
+            panel_titles = [None] * len(datasets)
+            panels = list(datasets)
+        else:
+            logger.error(f"Invalid input type for datasets: {type(datasets)}")
+            raise TypeError("Grid input must be a dict of {title: energy_data} or a list of energy data.")
+        if not panels:
+            raise ValueError("No datasets to plot.")
+        if titles is not None:
+            panel_titles = list(titles)
+
+        def per_panel(values, i):
+            if values is None:
+                return None
+            if isinstance(values, dict):
+                return values.get(panel_keys[i])
+            return values[i] if i < len(values) else None
+
+        # Resolve one colour per series label over all panels
+        series_labels, shared_energies = [], []
+        for data in panels:
+            for k, values in self._process_energy_data(data).items():
+                if include_keys is not None and k not in include_keys:
+                    continue
+                if k not in series_labels:
+                    series_labels.append(k)
+                shared_energies.extend(e for e in values if e is not None and not np.isnan(e))
+        # With shared y-limits, offset the labels by the same amount in every panel
+        energy_range = max(shared_energies) - min(shared_energies) if sharey and shared_energies else None
+        series_colors = dict(zip(series_labels, self._resolve_colors(self.colors, len(series_labels))))
+
+        n = len(panels)
+        ncols = ncols or int(np.ceil(np.sqrt(n)))
+        nrows = int(np.ceil(n / ncols))
+        fig, axes = plt.subplots(nrows, ncols, figsize=(self.figsize[0] * ncols, self.figsize[1] * nrows), squeeze=False)
+        axes = axes.ravel()
+        for ax in axes[n:]:
+            fig.delaxes(ax)
+        axes = axes[:n]
+
+        panel_energies = []
+        for i, (ax, data) in enumerate(zip(axes, panels)):
+            self.draw(
+                data,
+                point_labels=per_panel(point_labels, i),
+                include_keys=include_keys,
+                exclude_from_legend=exclude_from_legend,
+                ax=ax,
+                tight_layout=False,
+                series_colors=series_colors,
+                energy_range=energy_range,
+            )
+            panel_energies.append(self._all_energies)
+            if panel_titles[i] is not None:
+                ax.set_title(panel_titles[i], fontproperties=self.font_properties)
+
+        def share_ylim():
+            if sharey:
+                limits = [ax.get_ylim() for ax in axes]
+                for ax in axes:
+                    ax.set_ylim(min(l[0] for l in limits), max(l[1] for l in limits))
+
+        # Annotations go below the (shared) data range, so they are drawn once the limits are known
+        share_ylim()
+        for i, ax in enumerate(axes):
+            self.annotations = self._clean_annotations(per_panel(annotations, i))
+            self._draw_annotations(ax, panel_energies[i])
+        share_ylim()
 
-                x_center = (x_start + x_end) / 2
-                
-                if not self.annotation_below_arrow:
-                    bbox_props = dict(
-                    boxstyle='round,pad=0.2',
-                    facecolor='white',
-                    edgecolor='none',
-                    ) 
-                    ax.annotate(
-                        label,
-                        xy=(x_center, y_arrow),
-                        xytext=(0, 0),
-                        textcoords='offset points',
-                        ha='center',
-                        va='center',
-                        color=self.annotation_color,
-                        bbox=bbox_props,
-                        **self.annotation_kwargs,
-                    )
-                else:
-                    ax.text(
-                        x_center, y_arrow - 0.3,
-                        label,
-                        ha='center', va='top',
-                        color=self.annotation_color,
-                        **self.annotation_kwargs,
-                    )
-            # only draw if there is no x-axis to be shown
-            if self.axes in ['x', 'both', 'box']:
-                y_min, y_max = ax.get_ylim()
-                energy_range = max(all_energies) - min(all_energies)
-
-                y_buffer = self.annotation_space * energy_range
-                if increase_label_space:
-                    y_buffer = y_buffer * 1.75
-                if self.annotation_below_arrow:
-                    y_buffer = y_buffer * 2
-                ax.set_ylim(y_min - y_buffer, y_max)
+        fig.tight_layout()
+        return fig, axes
+
+    def plot_grid(self, datasets, filename=None, file_format='png', dpi=600, **kwargs):
+        """Draw a multi-panel figure with :meth:`draw_grid` and save it once."""
+        fig, axes = self.draw_grid(datasets, **kwargs)
+
+        if filename:
+            self.save(fig, f"{filename}.{file_format}", file_format=file_format, dpi=dpi)
+
+        return None
+
+    def draw_ensemble(self, ensemble_data, temperature=298.15, method='boltzmann', band='minmax', annotations=None, **kwargs):
+        """Draw conformer-ensemble profiles with a shaded envelope band; returns ``(fig, ax)``.
+
+        Each position of each profile holds a list of conformer energies. The curve is
+        the ensemble value from :func:`~plotprofile.ensemble.reduce_ensembles` at
+        ``temperature`` (K), and the band spans the ``band`` envelope (``'minmax'`` or a
+        ``(low, high)`` pair of percentiles), widened where needed to contain the curve.
+        Other keyword arguments go to :meth:`draw`.
+        """
+        energies, lower, upper = reduce_ensembles(ensemble_data, temperature=temperature, units=self.units, method=method, band=band)
+        fig, ax = self.draw(energies, **kwargs)
+
+        band_values = []
+        for label, color in self._drawn_colors.items():
+            # Band points at the curve's own x positions: a run of equal energies is drawn
+            # once at its midpoint, so the band there spans the whole run
+            lo_pts, hi_pts = [], []
+            values, i = energies[label], 0
+            while i < len(values):
+                if values[i] is None:
+                    i += 1
+                    continue
+                j = i + 1
+                while j < len(values) and values[j] == values[i]:
+                    j += 1
+                x = (i + j - 1) / 2 if j - i > 1 else i
+                lo_pts.append((x, min(lower[label][i:j])))
+                hi_pts.append((x, max(upper[label][i:j])))
+                i = j
+            band_values += [y for _, y in lo_pts + hi_pts]
+            if len(lo_pts) < 2 or len(hi_pts) < 2:
+                for (x, lo), (_, hi) in zip(lo_pts, hi_pts):
+                    ax.vlines(x, lo, hi, color=color, alpha=self.band_alpha, linewidth=3 * self.line_width, zorder=1)
+                continue
+            lo_curve = self._curve_points(lo_pts)
+            hi_curve = self._curve_points(hi_pts)
+            ax.fill(
+                np.concatenate([lo_curve[:, 0], hi_curve[::-1, 0]]),
+                np.concatenate([lo_curve[:, 1], hi_curve[::-1, 1]]),
+                color=color, alpha=self.band_alpha, linewidth=0, zorder=1,
+            )
+
+        if band_values:
+            padding = self.buffer_factor * (max(band_values) - min(band_values))
+            y_min, y_max = ax.get_ylim()
+            ax.set_ylim(min(y_min, min(band_values) - padding), max(y_max, max(band_values) + padding))
+
+        # Annotations sit below everything drawn so far, so add them once the band is in place
+        self.annotations = self._clean_annotations(annotations)
+        self._base_ylim = ax.get_ylim()
+        self._annotation_artists = self._draw_annotations(ax, self._all_energies)
+        return fig, ax
+
+    def plot_ensemble(self, ensemble_data, filename=None, file_format='png', dpi=600, **kwargs):
+        """Draw a conformer-ensemble profile with :meth:`draw_ensemble` and save it."""
+        fig, ax = self.draw_ensemble(ensemble_data, **kwargs)
+
+        if filename:
+            self.save(fig, f"{filename}.{file_format}", file_format=file_format, dpi=dpi)
+
+        return None
+
+    def draw_network(self, network, annotations=None, label_states=False, include_keys=None, mark_span=False, **kwargs):
+        """Draw a reaction network, drawing each shared stretch of pathways once; returns ``(fig, ax)``.
+
+        ``network`` is ``{"states": {state: energy}, "pathways": {label: [states]}}``
+        (see :func:`~plotprofile.network.split_network`). Stretches used by several
+        pathways are drawn in ``shared_color``; the branches take the pathway colours.
+        ``label_states=True`` writes the state names as point labels. Other keyword
+        arguments go to :meth:`draw`.
+        """
+        if include_keys is not None:
+            network = {**network, 'pathways': {k: v for k, v in network['pathways'].items() if k in include_keys}}
+        pathway_labels = list(network['pathways'])
+        if self.stable_colors:
+            pathway_colors = dict(zip(pathway_labels, self.assign_colors(pathway_labels)))
+        else:
+            pathway_colors = dict(zip(pathway_labels, self._resolve_colors(self.colors, len(pathway_labels))))
+
+        series, series_colors, state_labels, shared, branches = {}, {}, {}, [], []
+        for _, parent, users, energies, states in split_network(network):
+            if len(users) == 1:
+                label = users[0]
+                series_colors[label] = pathway_colors[label]
             else:
-                y_min, y_max = ax.get_ylim()
-                energy_range = max(all_energies) - min(all_energies)
+                label = f"_shared_{len(shared)}"
+                series_colors[label] = mpc.to_rgba(self.shared_color)
+                shared.append(label)
+            series[label] = energies
+            state_labels[label] = states
+            if parent is not None:
+                branches.append(label)
+        for label in pathway_labels:
+            if label not in series:
+                logger.info(f"Pathway '{label}' has no states of its own; it is drawn only by shared segments.")
+
+        fig, ax = self.draw(series, annotations=annotations, point_labels=state_labels if label_states else None, series_colors=series_colors, **kwargs)
+
+        for label in shared:
+            if label in self._artists['curves']:
+                self._artists['curves'][label].set_color(series_colors[label])  # not desaturated
+        # A branch starts on the last point of its parent, which already has a marker there
+        for label in branches:
+            points = self._artists['points'].get(label)
+            if points:
+                points.pop(0).remove()
+
+        if mark_span:
+            self._mark_energetic_span(ax, pathway_energies(network))
+        return fig, ax
+
+    def plot_network(self, network, filename=None, file_format='png', dpi=600, **kwargs):
+        """Draw a reaction network with :meth:`draw_network` and save it."""
+        fig, ax = self.draw_network(network, **kwargs)
+
+        if filename:
+            self.save(fig, f"{filename}.{file_format}", file_format=file_format, dpi=dpi)
 
-                y_buffer = self.annotation_space * energy_range 
-                ax.set_ylim(y_min - y_buffer, y_max)
+        return None
 
+    def _mark_energetic_span(self, ax, profiles):
+        """Draw the energetic span of each profile from its TDI level up to its TDTS."""
+        def run_midpoint(energies, idx):
+            end = idx
+            while end + 1 < len(energies) and energies[end + 1] == energies[idx]:
+                end += 1
+            return (idx + end) / 2
+
+        for label, result in energetic_span(profiles, units=self.units).items():
+            if result['tdts'] is None:
+                continue
+            energies = profiles[label]
+            x_ts = run_midpoint(energies, result['tdts'])
+            x_i = run_midpoint(energies, result['tdi'])
+            color = self._drawn_colors.get(label, self.arrow_color)
+            tdi_energy, tdts_energy = result['tdi_energy'], result['tdts_energy']
+
+            ax.hlines(tdi_energy, min(x_i, x_ts), max(x_i, x_ts), colors=color, linestyles='dotted', linewidth=self.arrow_width)
+            ax.annotate(
+                '',
+                xy=(x_ts, tdts_energy),
+                xytext=(x_ts, tdi_energy),
+                arrowprops=dict(arrowstyle='<->', color=color, lw=self.arrow_width, shrinkA=0, shrinkB=0),
+            )
+            span_text = f"δE = {result['energetic_span']:.{self.sig_figs}f}".replace('-', '−')
+            ax.annotate(
+                span_text,
+                xy=(x_ts, (tdi_energy + tdts_energy) / 2),
+                xytext=(4, 0),
+                textcoords='offset points',
+                ha='left',
+                va='center',
+                color=color,
+                bbox=dict(boxstyle='round,pad=0.2', facecolor='white', edgecolor='none'),
+                **self.annotation_kwargs,
+            )
+
+    def _style_axes(self, ax):
+        """Apply the data-independent styling: axis labels, spines and tick parameters."""
         if self.y_label is not None:
             ax.set_ylabel(self.y_label, fontproperties=self.font_properties)
         else:
@@ -749,12 +1508,40 @@ class ReactionProfilePlotter:
             ax.set_xlabel(None)
             ax.set_ylabel(None)
 
-        fig.tight_layout()
-
-        if filename:
-            fig.savefig(f"{filename}.{file_format}", format=file_format, dpi=dpi, bbox_inches='tight')
 
-        return None
+class ProfileTemplate:
+    """A styled figure built once from a :class:`ReactionProfilePlotter` and reused for many renders.
+
+    Axis labels, spines, ticks and the figure layout are set up when the template
+    is created; each :meth:`render` only clears and redraws the data artists.
+    """
+
+    def __init__(self, plotter):
+        self.plotter = plotter
+        self.fig = Figure(figsize=plotter.figsize)
+        self.ax = self.fig.add_subplot()
+        plotter._style_axes(self.ax)
+        self.fig.tight_layout()
+
+    def clear(self):
+        """Remove the data artists, keeping the axes styling."""
+        ax = self.ax
+        for artist in [*ax.lines, *ax.texts, *ax.patches, *ax.collections]:
+            artist.remove()
+        if ax.get_legend() is not None:
+            ax.get_legend().remove()
+        ax.relim()
+        ax.autoscale(True)
+
+    def draw(self, energy_data, **kwargs):
+        self.clear()
+        return self.plotter.draw(energy_data, ax=self.ax, style_axes=False, tight_layout=False, **kwargs)
+
+    def render(self, energy_data, filename, file_format='png', dpi=600, **kwargs):
+        """Redraw ``energy_data`` on the template and save it to ``filename`` (a path without extension, or a file object)."""
+        self.draw(energy_data, **kwargs)
+        target = filename if hasattr(filename, 'write') else f"{filename}.{file_format}"
+        return self.plotter.save(self.fig, target, file_format=file_format, dpi=dpi)
 
 
 # Convenience function (no need to instantiate class)
@@ -0,0 +1,365 @@
+import argparse
+import io
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import urlparse, parse_qs
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Seconds a worker gets past its time limit to raise on its own before it is killed
+KILL_GRACE = 5.0
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+    'eps': 'application/postscript',
+}
+
+
+# --- worker side (runs inside the pool processes)
+
+def _init_worker():
+    """Import matplotlib, read the styles and scan the fonts once per worker."""
+    import matplotlib
+    matplotlib.use('Agg')
+    from . import plot
+
+    plot._read_styles()
+    plot._available_fonts()
+    # Render once so the text and font caches are warm before the first request
+    _render({"_warmup_": [0.0, 1.0, 0.0]}, {'format': 'png', 'dpi': 10})
+
+
+def _warm():
+    return os.getpid()
+
+
+def _on_alarm(signum, frame):
+    raise TimeoutError('render exceeded its time limit')
+
+
+def _render_limited(payload, options, timeout):
+    """Run :func:`_render` under a SIGALRM time limit, so a slow render frees its worker."""
+    if not timeout or not hasattr(signal, 'SIGALRM'):
+        return _render(payload, options)
+    import matplotlib.pyplot as plt
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return _render(payload, options)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        # An interrupted render can leave its figure behind
+        plt.close('all')
+
+
+def _render(payload, options, target=None):
+    """Render a CLI-style JSON payload and return the image bytes, or save it to ``target`` if given."""
+    import matplotlib.pyplot as plt
+    from .plot import ReactionProfilePlotter
+
+    energy_data, annotations, point_labels = payload, None, None
+    style_kwargs = dict(options.get('overrides', {}))
+    if isinstance(payload, dict) and 'energies' in payload:
+        energy_data = payload['energies']
+        annotations = payload.get('annotations')
+        point_labels = payload.get('point_labels')
+        style_kwargs.update(payload.get('style_overrides', {}))
+
+    plotter = ReactionProfilePlotter(style=options.get('style', 'default'), **style_kwargs)
+    if options.get('dashed'):
+        plotter.dashed = options['dashed']
+
+    fig, _ = plotter.draw(
+        energy_data,
+        annotations=annotations,
+        point_labels=point_labels,
+        include_keys=options.get('include'),
+    )
+    try:
+        buf = io.BytesIO() if target is None else target
+        written = plotter.save(fig, buf, file_format=options.get('format', 'png'), dpi=options.get('dpi', 600))
+    finally:
+        plt.close(fig)
+    return buf.getvalue() if target is None else written
+
+
+# --- server side
+
+class _Metrics:
+    def __init__(self, window=60.0):
+        self.window = window
+        self.started = time.time()
+        self.requests = 0
+        self.renders = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total_render_time = 0.0
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+
+    def finish(self, elapsed, ok):
+        now = time.time()
+        with self._lock:
+            self.in_flight -= 1
+            if ok:
+                self.renders += 1
+                self.total_render_time += elapsed
+                self._recent.append(now)
+            else:
+                self.errors += 1
+            while self._recent and now - self._recent[0] > self.window:
+                self._recent.popleft()
+
+    def snapshot(self):
+        now = time.time()
+        with self._lock:
+            while self._recent and now - self._recent[0] > self.window:
+                self._recent.popleft()
+            uptime = now - self.started
+            return {
+                'uptime_s': round(uptime, 3),
+                'requests': self.requests,
+                'renders': self.renders,
+                'errors': self.errors,
+                'in_flight': self.in_flight,
+                'mean_render_ms': round(1000 * self.total_render_time / self.renders, 3) if self.renders else None,
+                'renders_per_s': round(len(self._recent) / min(self.window, uptime), 3) if uptime > 0 else 0.0,
+            }
+
+
+class _RenderHandler(BaseHTTPRequestHandler):
+    server_version = 'plotprofile'
+
+    def address_string(self):
+        # Unix sockets have no (host, port) client address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status, body, content_type='application/json'):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        app = self.server.app
+        path = urlparse(self.path).path
+        if path == '/health':
+            health = app.health()
+            self._send(200 if health['status'] == 'ok' else 503, health)
+        elif path == '/metrics':
+            self._send(200, app.metrics.snapshot())
+        else:
+            self._send(404, {'error': f"Unknown path '{path}'"})
+
+    def do_POST(self):
+        app = self.server.app
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._send(404, {'error': f"Unknown path '{url.path}'"})
+            return
+
+        try:
+            options = _parse_options(parse_qs(url.query))
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'null')
+        except (ValueError, TypeError) as e:
+            self._send(400, {'error': str(e)})
+            return
+
+        app.metrics.start()
+        t0 = time.perf_counter()
+        try:
+            data = app.render(payload, options)
+        except Exception as e:
+            app.metrics.finish(time.perf_counter() - t0, ok=False)
+            logger.error(f"Render failed: {e}")
+            self._send(422, {'error': str(e)})
+            return
+        app.metrics.finish(time.perf_counter() - t0, ok=True)
+        self._send(200, data, CONTENT_TYPES[options['format']])
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def _parse_options(query):
+    def first(name, default=None):
+        return query.get(name, [default])[0]
+
+    def as_list(name):
+        values = [v for item in query.get(name, []) for v in item.split(',') if v]
+        return values or None
+
+    file_format = first('format', 'png')
+    if file_format not in CONTENT_TYPES:
+        raise ValueError(f"Unsupported format '{file_format}'; choose from {sorted(CONTENT_TYPES)}")
+    return {
+        'format': file_format,
+        'style': first('style', 'default'),
+        'dpi': int(first('dpi', 600)),
+        'include': as_list('include'),
+        'dashed': as_list('dashed'),
+    }
+
+
+class RenderServer:
+    """Serve renders over localhost HTTP or a Unix socket from a pool of warm workers.
+
+    ``POST /render`` takes the same JSON the CLI reads from ``--input`` (or an
+    envelope ``{"energies": ..., "annotations": ..., "point_labels": ..., "style_overrides": {...}}``)
+    and returns the image bytes. Query parameters mirror the CLI: ``format``,
+    ``style``, ``dpi``, ``include`` and ``dashed`` (comma separated).
+    ``GET /health`` and ``GET /metrics`` report status and throughput.
+
+    A render running past ``timeout`` seconds fails and frees its worker. If a
+    worker is still stuck ``KILL_GRACE`` seconds later, the pool is replaced by a
+    fresh one and the old pool's processes are killed; renders still running in
+    the old pool fail.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, socket_path=None, workers=None, timeout=60.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.metrics = _Metrics()
+        self._lock = threading.Lock()
+        self.executor = self._start_pool()
+        # Start every worker up front so the first requests don't pay the warm-up
+        pids = {f.result() for f in [self.executor.submit(_warm) for _ in range(self.workers)]}
+        logger.info(f"Started {len(pids)} warm render workers.")
+
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.httpd = _ThreadingUnixHTTPServer(socket_path, _RenderHandler)
+            self.address = socket_path
+        else:
+            self.httpd = _ThreadingHTTPServer((host, port), _RenderHandler)
+            self.address = f"http://{host}:{self.httpd.server_address[1]}"
+        self.socket_path = socket_path
+        self.httpd.app = self
+
+    def _start_pool(self):
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+        )
+
+    def render(self, payload, options):
+        """Render in the pool and return the bytes.
+
+        A render stuck past its time limit gets the pool replaced and raises
+        ``TimeoutError``. If a worker has died (killed, out of memory, crashed) the
+        pool is broken; it is replaced and the render retried once.
+        """
+        for attempt in (1, 2):
+            executor = self.executor
+            future = None
+            try:
+                future = executor.submit(_render_limited, payload, options, self.timeout)
+                return future.result(timeout=self.timeout + KILL_GRACE if self.timeout else None)
+            except BrokenProcessPool:
+                self.recycle(executor)
+                if attempt == 2:
+                    raise
+                logger.warning("A render worker died; retrying on a fresh pool.")
+            except Exception:
+                if future is not None and not future.done():
+                    # The worker ignored its time limit (e.g. stuck inside the renderer)
+                    self.recycle(executor)
+                    raise TimeoutError(f"render exceeded {self.timeout} s; worker pool restarted")
+                raise
+
+    def health(self):
+        """Report the pool state; a pool with a dead worker is replaced and reported as ``broken``."""
+        executor = self.executor
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        alive = sum(p.is_alive() for p in processes)
+        if getattr(executor, '_broken', False) or alive < len(processes):
+            self.recycle(executor)
+            return {'status': 'broken', 'workers': self.workers, 'alive': alive}
+        return {'status': 'ok', 'workers': self.workers, 'alive': alive}
+
+    def recycle(self, executor):
+        """Replace ``executor`` with a fresh pool and kill its processes (once, however many requests ask)."""
+        with self._lock:
+            if self.executor is not executor:
+                return
+            self.executor = self._start_pool()
+        logger.warning("Restarting the render worker pool.")
+        # ProcessPoolExecutor has no public way to stop a busy worker
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False)
+
+    def serve_forever(self):
+        logger.info(f"Serving reaction profiles on {self.address}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self):
+        self.httpd.shutdown()
+
+    def close(self):
+        self.httpd.server_close()
+        self.executor.shutdown(wait=False)
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve_main(argv=None):
+    parser = argparse.ArgumentParser(prog='plotprofile serve', description="Serve reaction profile renders from warm worker processes")
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Host to bind for HTTP')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind for HTTP')
+    parser.add_argument('--socket', type=str, help='Listen on this Unix socket path instead of HTTP')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-render timeout in seconds')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server = RenderServer(
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+        workers=args.workers,
+        timeout=args.timeout,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
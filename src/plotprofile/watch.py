@@ -0,0 +1,106 @@
+import logging
+import os
+import time
+
+import matplotlib.pyplot as plt
+
+from .cli import _load_energy_json, _load_json
+from .plot import ReactionProfilePlotter
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class ProfileWatcher:
+    """Re-render a profile whenever its input, annotations or style file changes.
+
+    The figure is kept alive between renders. A change to the annotations file
+    only replaces the annotation arrows and texts; changes to the input or style
+    file rebuild the figure.
+    """
+
+    def __init__(self, input_path, output, file_format='png', annotations_path=None, style_file=None,
+                 style_kwargs=None, dashed=None, include_keys=None, dpi=600, interval=0.5):
+        self.paths = {
+            'input': input_path,
+            'annotations': annotations_path,
+            'style': style_file,
+        }
+        self.output = output
+        self.file_format = file_format
+        self.style_kwargs = style_kwargs or {}
+        self.dashed = dashed
+        self.include_keys = include_keys
+        self.dpi = dpi
+        self.interval = interval
+
+        self.plotter = None
+        self.fig = None
+        self.ax = None
+        self._stamps = {}
+
+    def _stamp(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def poll(self):
+        """Return the set of watched files ('input', 'annotations', 'style') changed since the last poll."""
+        changed = set()
+        for role, path in self.paths.items():
+            if not path:
+                continue
+            stamp = self._stamp(path)
+            if self._stamps.get(role) != stamp:
+                self._stamps[role] = stamp
+                changed.add(role)
+        return changed
+
+    def rebuild(self):
+        if self.fig is not None:
+            plt.close(self.fig)
+            self.fig = None
+
+        style_kwargs = {**(_load_json(self.paths['style']) or {}), **self.style_kwargs}
+        self.plotter = ReactionProfilePlotter(**style_kwargs)
+        if self.dashed:
+            self.plotter.dashed = self.dashed
+
+        self.fig, self.ax = self.plotter.draw(
+            _load_energy_json(self.paths['input']),
+            annotations=_load_json(self.paths['annotations']),
+            include_keys=self.include_keys,
+        )
+
+    def render(self, changed):
+        if self.fig is None or changed - {'annotations'}:
+            self.rebuild()
+            logger.info(f"Rebuilt figure ({', '.join(sorted(changed))} changed).")
+        else:
+            self.plotter.update_annotations(self.ax, _load_json(self.paths['annotations']))
+            logger.info("Updated annotations.")
+
+        filename = f"{self.output}.{self.file_format}"
+        if self.plotter.save(self.fig, filename, file_format=self.file_format, dpi=self.dpi):
+            logger.info(f"Wrote {filename}")
+
+    def run(self):
+        logging.basicConfig(level=logging.INFO)
+        logger.info(f"Watching {', '.join(p for p in self.paths.values() if p)} (Ctrl-C to stop).")
+        try:
+            while True:
+                changed = self.poll()
+                if changed:
+                    try:
+                        self.render(changed)
+                    except Exception as e:
+                        # Files are often mid-edit; keep watching and try again on the next change
+                        logger.error(f"Render failed: {e}")
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.fig is not None:
+                plt.close(self.fig)